@@ -10,23 +10,34 @@ Date: November 2025
 
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
-import time
+import pyarrow as pa
+import io
 import json
-from streamlit_autorefresh import st_autorefresh
+from contextlib import contextmanager
+from operator import itemgetter
 from utils import (
     fetch_recent_decisions,
     get_summary_stats,
-    fetch_current_carbon_data,
     get_region_history,
     get_ai_insights,
     get_energy_mix_data,
     generate_mock_decisions,
-    generate_mock_history
+    generate_mock_history,
+    lttb_indices,
+    clear_data_caches,
+    REGION_FLAGS
 )
+from predictor import SimplePredictiveScheduler
+
+# Optional: faster JSON export
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # ============================================================================
 # PAGE CONFIG
@@ -43,6 +54,10 @@ if 'high_contrast' not in st.session_state:
     st.session_state.high_contrast = False
 if 'data_loading_failed' not in st.session_state:
     st.session_state.data_loading_failed = False
+if 'low_power' not in st.session_state:
+    st.session_state.low_power = False
+if 'optimization_weights' not in st.session_state:
+    st.session_state.optimization_weights = None
 
 # ============================================================================
 # HELPER FUNCTIONS
@@ -56,76 +71,108 @@ def render_skeleton_loader():
     <div class="skeleton" style="height: 300px; margin: 10px 0;"></div>
     """, unsafe_allow_html=True)
 
+def render_skeleton_block(title, height):
+    """Render a section heading and its skeleton placeholder as one markdown message"""
+    st.markdown(
+        f'### {title}\n\n<div class="skeleton" style="height: {height}px;"></div>',
+        unsafe_allow_html=True
+    )
+
+def _df_fingerprint(df):
+    """Cache key for a DataFrame: row count plus a hash of every row, so any edit changes it"""
+    if df.empty:
+        return (0, 0)
+    return (len(df), int(pd.util.hash_pandas_object(df, index=False).sum()))
+
+@contextmanager
+def chart_container(title):
+    """Bordered container with a chart title, styled like .chart-container.
+
+    Replaces paired '<div>'/'</div>' markdown calls, which Streamlit renders as
+    separate elements and so never actually wrapped the chart.
+    """
+    with st.container(border=True):
+        st.markdown(f'<h3 class="chart-title">{title}</h3>', unsafe_allow_html=True)
+        yield
+
+def _downcast_integers(df):
+    """Shrink integer columns to the narrowest type that holds their values"""
+    int_cols = df.select_dtypes('integer').columns
+    return df.assign(**{col: pd.to_numeric(df[col], downcast='integer') for col in int_cols})
+
+_HIGH_CONTRAST_CSS = """
+<style>
+    .stApp {
+        background: #000000 !important;
+    }
+    .stMarkdown, .stMarkdown p, .stMarkdown span, .metric-label, .metric-value {
+        color: #FFFFFF !important;
+    }
+    .hero-title {
+        background: linear-gradient(90deg, #FFFFFF 0%, #FFFF00 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+    }
+    .metric-card, .chart-container {
+        background: #1a1a1a !important;
+        border: 2px solid #FFFFFF !important;
+    }
+    .chart-title,
+    [data-testid="stVerticalBlockBorderWrapper"] h3 {
+        color: #FFFF00 !important;
+    }
+    .insight-card {
+        background: #1a1a1a !important;
+        border-left: 4px solid #FFFF00 !important;
+        color: #FFFFFF !important;
+        min-height: 160px;
+        display: flex;
+        flex-direction: column;
+        justify-content: center;
+    }
+    .insight-card *,
+    .insight-card h1,
+    .insight-card h2,
+    .insight-card h3,
+    .insight-card h4,
+    .insight-card h5,
+    .insight-card h6,
+    .insight-card p,
+    .insight-card span,
+    .insight-card div,
+    .insight-card strong,
+    .insight-card em,
+    .insight-card a {
+        font-family: 'Orbitron', monospace !important;
+    }
+    .insight-title {
+        color: #FFFF00 !important;
+        font-family: 'Orbitron', monospace !important;
+        font-weight: 600 !important;
+    }
+    .insight-text {
+        color: #FFFFFF !important;
+        font-family: 'Orbitron', monospace !important;
+    }
+    .insight-metric {
+        background: #FFFF00 !important;
+        color: #000000 !important;
+        font-family: 'Orbitron', monospace !important;
+        font-weight: 700 !important;
+    }
+</style>
+"""
+
 def apply_high_contrast_css():
     """Apply high contrast CSS overrides"""
     if st.session_state.high_contrast:
-        st.markdown("""
-        <style>
-            .stApp {
-                background: #000000 !important;
-            }
-            .stMarkdown, .stMarkdown p, .stMarkdown span, .metric-label, .metric-value {
-                color: #FFFFFF !important;
-            }
-            .hero-title {
-                background: linear-gradient(90deg, #FFFFFF 0%, #FFFF00 100%);
-                -webkit-background-clip: text;
-                -webkit-text-fill-color: transparent;
-            }
-            .metric-card, .chart-container {
-                background: #1a1a1a !important;
-                border: 2px solid #FFFFFF !important;
-            }
-            .chart-title {
-                color: #FFFF00 !important;
-            }
-            .insight-card {
-                background: #1a1a1a !important;
-                border-left: 4px solid #FFFF00 !important;
-                color: #FFFFFF !important;
-                min-height: 160px;
-                display: flex;
-                flex-direction: column;
-                justify-content: center;
-            }
-            .insight-card *,
-            .insight-card h1,
-            .insight-card h2,
-            .insight-card h3,
-            .insight-card h4,
-            .insight-card h5,
-            .insight-card h6,
-            .insight-card p,
-            .insight-card span,
-            .insight-card div,
-            .insight-card strong,
-            .insight-card em,
-            .insight-card a {
-                font-family: 'Orbitron', monospace !important;
-            }
-            .insight-title {
-                color: #FFFF00 !important;
-                font-family: 'Orbitron', monospace !important;
-                font-weight: 600 !important;
-            }
-            .insight-text {
-                color: #FFFFFF !important;
-                font-family: 'Orbitron', monospace !important;
-            }
-            .insight-metric {
-                background: #FFFF00 !important;
-                color: #000000 !important;
-                font-family: 'Orbitron', monospace !important;
-                font-weight: 700 !important;
-            }
-        </style>
-        """, unsafe_allow_html=True)
+        st.markdown(_HIGH_CONTRAST_CSS, unsafe_allow_html=True)
 
 # ============================================================================
 # CUSTOM CSS - FUTURISTIC NEON THEME
 # ============================================================================
 
-st.markdown("""
+_CSS = """
 <style>
     /* Import Google Fonts */
     @import url('https://fonts.googleapis.com/css2?family=Orbitron:wght@400;500;600;700;900&display=swap');
@@ -221,17 +268,17 @@ st.markdown("""
         letter-spacing: 0.05em !important;
     }
 
-    /* Loading Skeleton */
+    /* Loading Skeleton - static fill (background-position animations repaint on the CPU) */
     .skeleton {
-        background: linear-gradient(90deg, rgba(255,255,255,0.1) 25%, rgba(255,255,255,0.2) 50%, rgba(255,255,255,0.1) 75%);
-        background-size: 200% 100%;
-        animation: loading 1.5s ease-in-out infinite;
+        background: rgba(255, 255, 255, 0.15);
         border-radius: 10px;
     }
 
-    @keyframes loading {
-        0% { background-position: 200% 0; }
-        100% { background-position: -200% 0; }
+    .skeleton-grid,
+    .metric-row {
+        display: grid;
+        grid-template-columns: repeat(4, 1fr);
+        gap: 1rem;
     }
 
     /* Ensure Streamlit columns are uniform */
@@ -374,8 +421,27 @@ st.markdown("""
         -moz-osx-font-smoothing: grayscale;
     }
 
+    /* Compact metric stack used inside narrow columns */
+    .metric-grid {
+        display: flex;
+        flex-direction: column;
+        gap: 0.75rem;
+    }
+
+    .metric-grid .metric-card {
+        min-height: 0;
+        padding: 0.9rem 1.2rem;
+    }
+
+    .metric-grid .metric-value {
+        font-size: 1.5rem;
+        min-height: 0;
+        margin-bottom: 0;
+    }
+
     /* Chart Container */
-    .chart-container {
+    .chart-container,
+    [data-testid="stVerticalBlockBorderWrapper"]:has(> div > [data-testid="stVerticalBlock"]) {
         background: linear-gradient(135deg, rgba(10, 14, 39, 0.6) 0%, rgba(26, 26, 46, 0.6) 100%);
         border: 1px solid rgba(0, 255, 255, 0.2);
         border-radius: 15px;
@@ -384,7 +450,8 @@ st.markdown("""
         margin-bottom: 1.5rem;
     }
 
-    .chart-title {
+    .chart-title,
+    [data-testid="stVerticalBlockBorderWrapper"] h3 {
         font-family: 'Orbitron', monospace !important;
         font-size: 1.3rem;
         color: #ffffff;
@@ -529,6 +596,19 @@ st.markdown("""
         font-family: 'Orbitron', monospace !important;
     }
 
+    /* Insight cards laid out in a single HTML block */
+    .insight-grid {
+        display: grid;
+        grid-template-columns: 1fr 1fr;
+        gap: 1rem;
+    }
+
+    .insight-grid > .insight-card:last-child:nth-child(odd) {
+        grid-column: 1 / -1;
+        justify-self: center;
+        width: 50%;
+    }
+
     /* High specificity override for ALL elements inside insight cards */
     .insight-card *,
     .insight-card h1,
@@ -946,7 +1026,11 @@ st.markdown("""
         background-color: rgba(0, 255, 255, 0.3) !important;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Re-emitted on every rerun: Streamlit removes any element a run does not
+# produce, so a once-per-session guard would drop the stylesheet
+st.markdown(_CSS, unsafe_allow_html=True)
 
 # ============================================================================
 # HERO SECTION
@@ -969,94 +1053,97 @@ def render_hero():
 
 def render_metrics(stats):
     """Render metric cards with skeleton loaders for empty data"""
-    col1, col2, col3, col4 = st.columns(4)
-
     # Check if stats is empty or None
     if not stats or stats.get('total_decisions', 0) == 0:
-        # Render skeleton loaders
-        for col in [col1, col2, col3, col4]:
-            with col:
-                st.markdown("""
-                <div class="skeleton" style="height: 150px;"></div>
-                """, unsafe_allow_html=True)
+        # Render skeleton loaders in a single grid wrapper
+        st.markdown(
+            '<div class="skeleton-grid">'
+            + '<div class="skeleton" style="height: 150px;"></div>' * 4
+            + '</div>',
+            unsafe_allow_html=True
+        )
         return
 
-    with col1:
-        st.markdown(f"""
+    avg_carbon, savings, greenest, flag, total = (
+        stats.get('avg_carbon', 0),
+        stats.get('savings_percent', 0),
+        stats.get('greenest_region', 'N/A'),
+        stats.get('greenest_flag', '🌍'),
+        stats.get('total_decisions', 0)
+    )
+
+    # All four cards share one grid wrapper and one markdown message
+    st.markdown(f"""
+    <div class="metric-row">
         <div class="metric-card">
             <div class="metric-label">Avg Carbon Intensity</div>
-            <div class="metric-value">{stats.get('avg_carbon', 0):.1f}</div>
+            <div class="metric-value">{avg_carbon:.1f}</div>
             <div class="metric-delta">gCO₂/kWh</div>
         </div>
-        """, unsafe_allow_html=True)
-
-    with col2:
-        st.markdown(f"""
         <div class="metric-card">
             <div class="metric-label">Carbon Savings</div>
-            <div class="metric-value">{stats.get('savings_percent', 0):.1f}%</div>
+            <div class="metric-value">{savings:.1f}%</div>
             <div class="metric-delta">vs Average</div>
         </div>
-        """, unsafe_allow_html=True)
-
-    with col3:
-        st.markdown(f"""
         <div class="metric-card">
             <div class="metric-label">Greenest Region</div>
-            <div class="metric-value">{stats.get('greenest_region', 'N/A')}</div>
-            <div class="metric-delta">{stats.get('greenest_flag')}</div>
+            <div class="metric-value">{greenest}</div>
+            <div class="metric-delta">{flag}</div>
         </div>
-        """, unsafe_allow_html=True)
-
-    with col4:
-        st.markdown(f"""
         <div class="metric-card">
             <div class="metric-label">Total Decisions</div>
-            <div class="metric-value">{stats.get('total_decisions', 0)}</div>
+            <div class="metric-value">{total}</div>
             <div class="metric-delta">Last 7 days</div>
         </div>
-        """, unsafe_allow_html=True)
+    </div>
+    """, unsafe_allow_html=True)
 
 # ============================================================================
-# CARBON INTENSITY CHART
+# SHARED PLOTLY LAYOUT
 # ============================================================================
 
-def render_carbon_intensity_chart(data):
-    st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-    st.markdown('<h3 class="chart-title">Real-Time Carbon Intensity by Region</h3>', unsafe_allow_html=True)
+# Built once at import and merged into each figure's update_layout call
+_TRANSPARENT_BG = dict(paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)')
+_DARK_LAYOUT = dict(_TRANSPARENT_BG, font=dict(color='#00ffaa', family='Rajdhani'))
+_GRID_AXIS = dict(showgrid=True, gridcolor='rgba(0, 255, 255, 0.1)')
 
-    fig = go.Figure()
+# ============================================================================
+# CARBON INTENSITY CHART
+# ============================================================================
 
-    for region in data['region'].unique():
-        region_data = data[data['region'] == region]
-        fig.add_trace(go.Scatter(
-            x=region_data['timestamp'],
-            y=region_data['carbon_intensity'],
-            name=f"{region_data['region_flag'].iloc[0]} {region}",
-            mode='lines+markers',
-            line=dict(width=3),
-            marker=dict(size=8),
-            hovertemplate='<b>%{fullData.name}</b><br>' +
-                         'Time: %{x}<br>' +
-                         'Carbon: %{y} gCO₂/kWh<extra></extra>'
-        ))
+@st.cache_data(max_entries=8, show_spinner=False)
+def _build_carbon_intensity_figure(fingerprint, _data):
+    """Carbon intensity line chart, rebuilt only when the history fingerprint changes"""
+    import plotly.express as px
+
+    # Lines are drawn in row order, so sort once (stable, so ties keep
+    # their order) rather than trusting every caller to pass sorted rows
+    data = _data.sort_values('timestamp', kind='stable')
+
+    # One grouped pass instead of a boolean mask per region; the series
+    # label doubles as the legend entry ("<flag> <region>")
+    series = data['region_flag'].fillna('🌍') + ' ' + data['region']
+    fig = px.line(
+        data.assign(series=series),
+        x='timestamp',
+        y='carbon_intensity',
+        color='series',
+        markers=True
+    )
+    fig.update_traces(
+        line=dict(width=3),
+        marker=dict(size=8),
+        hovertemplate='<b>%{fullData.name}</b><br>' +
+                     'Time: %{x}<br>' +
+                     'Carbon: %{y} gCO₂/kWh<extra></extra>'
+    )
 
     fig.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='#00ffaa', family='Rajdhani'),
-        xaxis=dict(
-            showgrid=True,
-            gridcolor='rgba(0, 255, 255, 0.1)',
-            title='Time',
-            title_font=dict(color='#00ffff')
-        ),
-        yaxis=dict(
-            showgrid=True,
-            gridcolor='rgba(0, 255, 255, 0.1)',
-            title='Carbon Intensity (gCO₂/kWh)',
-            title_font=dict(color='#00ffff')
-        ),
+        legend_title_text='',
+        uirevision='carbon',
+        **_DARK_LAYOUT,
+        xaxis=dict(_GRID_AXIS, title='Time', title_font=dict(color='#00ffff')),
+        yaxis=dict(_GRID_AXIS, title='Carbon Intensity (gCO₂/kWh)', title_font=dict(color='#00ffff')),
         hovermode='x unified',
         height=400,
         legend=dict(
@@ -1066,394 +1153,807 @@ def render_carbon_intensity_chart(data):
         )
     )
 
-    st.plotly_chart(fig, use_container_width=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+    return fig
+
+def render_carbon_intensity_chart(data):
+    with chart_container("Real-Time Carbon Intensity by Region"):
+        fig = _build_carbon_intensity_figure(_df_fingerprint(data), data)
+        st.plotly_chart(fig, use_container_width=True, key="carbon_chart")
 
 # ============================================================================
 # REGION FREQUENCY CHART
 # ============================================================================
 
-def render_region_frequency_chart(data):
-    st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-    st.markdown('<h3 class="chart-title">Greenest Region Selection Frequency</h3>', unsafe_allow_html=True)
+# "<flag> <region>" axis labels, built once from the shared flag map
+_REGION_LABELS = {region: f"{flag} {region}" for region, flag in REGION_FLAGS.items()}
 
-    region_counts = data['region'].value_counts().reset_index()
-    region_counts.columns = ['region', 'count']
+@st.cache_data(max_entries=8, show_spinner=False)
+def _build_region_frequency_figure(fingerprint, _data):
+    """Region selection bar chart, rebuilt only when the logs fingerprint changes"""
+    # Read the counts straight off the Series (most selected first)
+    region_counts = _data['region'].value_counts()
+    regions = region_counts.index.to_numpy()
+    counts = region_counts.to_numpy()
 
     # Add flags
-    region_flags = {
-        'IN': '🇮🇳', 'FI': '🇫🇮', 'DE': '🇩🇪',
-        'JP': '🇯🇵', 'AU-NSW': '🇦🇺', 'BR-CS': '🇧🇷'
-    }
-    region_counts['display'] = region_counts['region'].map(
-        lambda x: f"{region_flags.get(x)} {x}"
-    )
+    display = [_REGION_LABELS.get(r, f"🌍 {r}") for r in regions]
 
     fig = go.Figure(data=[
         go.Bar(
-            x=region_counts['display'],
-            y=region_counts['count'],
+            x=display,
+            y=counts,
             marker=dict(
-                color=region_counts['count'],
+                color=counts,
                 colorscale='Viridis',
                 line=dict(color='rgba(0, 255, 255, 0.5)', width=2)
             ),
-            text=region_counts['count'],
+            text=counts,
             textposition='outside',
             hovertemplate='<b>%{x}</b><br>Selections: %{y}<extra></extra>'
         )
     ])
 
     fig.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='#00ffaa', family='Rajdhani'),
-        xaxis=dict(
-            showgrid=False,
-            title='Region',
-            title_font=dict(color='#00ffff')
-        ),
-        yaxis=dict(
-            showgrid=True,
-            gridcolor='rgba(0, 255, 255, 0.1)',
-            title='Number of Times Selected',
-            title_font=dict(color='#00ffff')
-        ),
+        **_DARK_LAYOUT,
+        xaxis=dict(showgrid=False, title='Region', title_font=dict(color='#00ffff')),
+        yaxis=dict(_GRID_AXIS, title='Number of Times Selected', title_font=dict(color='#00ffff')),
         height=400,
-        showlegend=False
+        showlegend=False,
+        uirevision='regions'
     )
 
-    st.plotly_chart(fig, use_container_width=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+    return fig
+
+def render_region_frequency_chart(data):
+    with chart_container("Greenest Region Selection Frequency"):
+        fig = _build_region_frequency_figure(_df_fingerprint(data), data)
+        st.plotly_chart(fig, use_container_width=True, key="region_frequency_chart")
 
 # ============================================================================
 # SAVINGS GAUGE
 # ============================================================================
 
-def render_savings_gauge(savings_percent):
-    st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-    st.markdown('<h3 class="chart-title">Carbon Savings Achievement</h3>', unsafe_allow_html=True)
-
-    fig = go.Figure(go.Indicator(
-        mode="gauge+number+delta",
-        value=savings_percent,
-        domain={'x': [0, 1], 'y': [0, 1]},
-        title={'text': "Savings %", 'font': {'color': '#00ffff', 'size': 20}},
-        delta={'reference': 50, 'increasing': {'color': "#00ff88"}},
-        gauge={
-            'axis': {'range': [None, 100], 'tickcolor': "#00ffff"},
-            'bar': {'color': "#00ff88"},
-            'bgcolor': "rgba(0,0,0,0)",
-            'borderwidth': 2,
-            'bordercolor': "rgba(0, 255, 255, 0.3)",
-            'steps': [
-                {'range': [0, 50], 'color': 'rgba(255, 0, 102, 0.2)'},
-                {'range': [50, 75], 'color': 'rgba(255, 193, 7, 0.2)'},
-                {'range': [75, 100], 'color': 'rgba(0, 255, 136, 0.2)'}
-            ],
-            'threshold': {
-                'line': {'color': "#7f00ff", 'width': 4},
-                'thickness': 0.75,
-                'value': 90
-            }
+# Static gauge styling, built once at import; only the value changes per render
+_GAUGE_TEMPLATE = dict(
+    mode="gauge+number+delta",
+    domain={'x': [0, 1], 'y': [0, 1]},
+    title={'text': "Savings %", 'font': {'color': '#00ffff', 'size': 20}},
+    delta={'reference': 50, 'increasing': {'color': "#00ff88"}},
+    gauge={
+        'axis': {'range': [None, 100], 'tickcolor': "#00ffff"},
+        'bar': {'color': "#00ff88"},
+        'bgcolor': "rgba(0,0,0,0)",
+        'borderwidth': 2,
+        'bordercolor': "rgba(0, 255, 255, 0.3)",
+        'steps': [
+            {'range': [0, 50], 'color': 'rgba(255, 0, 102, 0.2)'},
+            {'range': [50, 75], 'color': 'rgba(255, 193, 7, 0.2)'},
+            {'range': [75, 100], 'color': 'rgba(0, 255, 136, 0.2)'}
+        ],
+        'threshold': {
+            'line': {'color': "#7f00ff", 'width': 4},
+            'thickness': 0.75,
+            'value': 90
         }
-    ))
+    }
+)
 
-    fig.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='#00ffaa', family='Orbitron'),
-        height=300
+# Indicator traces have no plot area, so only the paper background is set
+_GAUGE_LAYOUT = dict(
+    paper_bgcolor=_TRANSPARENT_BG['paper_bgcolor'],
+    font=dict(color='#00ffaa', family='Orbitron'),
+    height=300
+)
+
+@st.cache_resource(max_entries=201, show_spinner=False)
+def _build_gauge_figure(bucket):
+    """Build the savings gauge figure for a 0.5% savings bucket (cached)"""
+    fig = go.Figure(go.Indicator(value=bucket / 2, **_GAUGE_TEMPLATE))
+    fig.update_layout(**_GAUGE_LAYOUT)
+    return fig
+
+@st.cache_data(max_entries=201, show_spinner=False)
+def _gauge_json(bucket):
+    """Serialize the gauge figure for a bucket once, skipping re-validation on reruns"""
+    import plotly.io as pio
+    return pio.to_json(_build_gauge_figure(bucket))
+
+def _gauge_bucket(savings_percent):
+    """Quantize savings to 0.5% steps in [0, 100] -> at most 201 gauge cache entries"""
+    return min(200, max(0, int(round(savings_percent * 2))))
+
+def _gauge_arc(start_pct, end_pct, color):
+    """SVG arc segment of the semicircular gauge between two percentages"""
+    points = []
+    for pct in (start_pct, end_pct):
+        angle = np.pi * (1 - pct / 100)
+        points.append((100 + 80 * np.cos(angle), 100 - 80 * np.sin(angle)))
+    (x1, y1), (x2, y2) = points
+    return (f'<path d="M {x1:.2f} {y1:.2f} A 80 80 0 0 1 {x2:.2f} {y2:.2f}" '
+            f'fill="none" stroke="{color}" stroke-width="18"/>')
+
+@st.cache_data(show_spinner=False)
+def _gauge_svg(bucket):
+    """Static SVG gauge body (arcs + needle) for a 0.5% savings bucket (cached)"""
+    angle = -90 + bucket * 0.9
+    return (
+        _gauge_arc(0, 50, 'rgba(255, 0, 102, 0.4)')
+        + _gauge_arc(50, 75, 'rgba(255, 193, 7, 0.4)')
+        + _gauge_arc(75, 100, 'rgba(0, 255, 136, 0.4)')
+        + f'<line x1="100" y1="100" x2="100" y2="28" stroke="#00ff88" stroke-width="4" '
+          f'stroke-linecap="round" transform="rotate({angle:.1f} 100 100)"/>'
+        + '<circle cx="100" cy="100" r="6" fill="#7f00ff"/>'
     )
 
-    st.plotly_chart(fig, use_container_width=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+@st.fragment
+def render_savings_gauge(savings_percent, mode='auto'):
+    """
+    Render the carbon savings gauge.
+
+    mode: 'plotly' for the interactive gauge, 'svg' for a static SVG gauge
+    without hover, 'compact' for a lightweight st.metric, or 'auto' to pick
+    'svg' when low-power mode is enabled.
+    """
+    if mode == 'auto':
+        mode = 'svg' if st.session_state.get('low_power') else 'plotly'
+
+    with st.container(border=True):
+        st.subheader("Carbon Savings Achievement")
+
+        if mode == 'compact':
+            st.metric("Savings", f"{savings_percent:.1f}%", delta=f"{savings_percent - 50:.1f}% vs 50% target")
+            return
+
+        if mode == 'svg':
+            bucket = _gauge_bucket(savings_percent)
+            st.markdown(
+                '<svg viewBox="0 0 200 130" style="width: 100%; max-height: 300px;">'
+                + _gauge_svg(bucket)
+                + f'<text x="100" y="125" text-anchor="middle" fill="#00ffff" font-size="16">'
+                  f'{savings_percent:.1f}%</text></svg>',
+                unsafe_allow_html=True
+            )
+            return
+
+        # Unchanged value since the last run: reuse this session's spec as-is.
+        # The chart itself must still be emitted, or Streamlit drops it from the page.
+        previous = st.session_state.get('gauge_spec')
+        if previous is not None and previous[0] == savings_percent:
+            spec = previous[1]
+        else:
+            # Reuse the cached spec for this bucket and only swap in the exact value.
+            # Parsing gives each rerun its own dict, so the shared figure is never mutated.
+            bucket = _gauge_bucket(savings_percent)
+            spec = json.loads(_gauge_json(bucket))
+            spec['data'][0]['value'] = savings_percent
+            st.session_state.gauge_spec = (savings_percent, spec)
+
+        # A stable key keeps the same chart instance across reruns, so only
+        # the changed value is pushed to the browser instead of a remount
+        st.plotly_chart(spec, use_container_width=True, key="savings_gauge")
 
 # ============================================================================
 # LIVE LOGS TABLE
 # ============================================================================
 
-def render_logs_table(logs_df):
-    st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-    st.markdown('<h3 class="chart-title">Recent Scheduling Decisions</h3>', unsafe_allow_html=True)
+LOG_DISPLAY_COLUMNS = ['timestamp', 'region_flag', 'region', 'carbon_intensity',
+                       'savings_gco2', 'savings_percent', 'status']
+LOG_NUMERIC_COLUMNS = ['carbon_intensity', 'savings_gco2', 'savings_percent']
+LOG_CATEGORY_COLUMNS = ['region', 'region_flag', 'status']
+
+# Presentation is done client-side by st.dataframe instead of in pandas
+LOG_COLUMN_CONFIG = {
+    'timestamp': st.column_config.DatetimeColumn("Timestamp", format="YYYY-MM-DD HH:mm:ss"),
+    'region_flag': st.column_config.TextColumn("Flag"),
+    'region': st.column_config.TextColumn("Region"),
+    'carbon_intensity': st.column_config.NumberColumn("Carbon (gCO₂/kWh)", format="%.0f"),
+    'savings_gco2': st.column_config.NumberColumn("Savings (gCO₂)", format="%.1f"),
+    'savings_percent': st.column_config.ProgressColumn(
+        "Savings %", format="%.1f%%", min_value=0, max_value=100
+    ),
+    'status': st.column_config.TextColumn("Status"),
+}
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _format_logs(fingerprint, _logs_df):
+    """Format the logs window for display, keyed on its fingerprint only.
+
+    Returns an Arrow table so st.dataframe skips the pandas conversion.
+    """
+    display_df = _logs_df.copy()
+
+    # Already-parsed timestamps go straight through; DatetimeColumn formats them client-side
+    if not pd.api.types.is_datetime64_any_dtype(display_df['timestamp']):
+        display_df['timestamp'] = pd.to_datetime(display_df['timestamp'], cache=True)
+
+    # Add status badges
+    # Missing statuses (pd.NA under Arrow dtypes) count as warnings
+    is_success = display_df['status'].eq('success').to_numpy(dtype=bool, na_value=False)
+    display_df['status'] = np.where(is_success, 'Success', 'Warning')
+
+    # float32 halves the bytes per value sent to the browser
+    display_df[LOG_NUMERIC_COLUMNS] = display_df[LOG_NUMERIC_COLUMNS].astype('float32')
 
-    if not logs_df.empty:
-        # Format the dataframe for display
-        display_df = logs_df.copy()
-        display_df['timestamp'] = pd.to_datetime(display_df['timestamp']).dt.strftime('%Y-%m-%d %H:%M:%S')
+    # Low-cardinality strings become dictionary-encoded Arrow columns
+    display_df[LOG_CATEGORY_COLUMNS] = display_df[LOG_CATEGORY_COLUMNS].astype('category')
+
+    return pa.Table.from_pandas(display_df, preserve_index=False)
+
+@st.fragment
+def render_logs_table(logs_df):
+    if logs_df.empty:
+        st.info("No decisions logged yet. Trigger the scheduler to see data!")
+        return
 
-        # Add status badges
-        display_df['status'] = display_df['status'].apply(
-            lambda x: 'Success' if x == 'success' else 'Warning'
+    with st.container(border=True):
+        st.subheader("Recent Scheduling Decisions")
+
+        # Cap the rows that get formatted and shipped to the browser.
+        # Logs arrive newest-first, so the head is the most recent window.
+        # The bounds follow the rows actually loaded, so every value does something.
+        n_rows = len(logs_df)
+        min_rows = min(10, n_rows)
+        current = st.session_state.get('log_page_size')
+        st.session_state.log_page_size = (
+            min(200, n_rows) if current is None else int(np.clip(current, min_rows, n_rows))
         )
+        page_size = st.number_input(
+            "Rows to show", min_value=min_rows, max_value=n_rows, step=10,
+            key='log_page_size'
+        )
+        logs_df = logs_df.head(int(page_size))
+
+        # Select the display columns first so only they are copied and formatted
+        logs_df = logs_df[LOG_DISPLAY_COLUMNS]
+        display_table = _format_logs(_df_fingerprint(logs_df), logs_df)
 
         st.dataframe(
-            display_df[['timestamp', 'region_flag', 'region', 'carbon_intensity',
-                       'savings_gco2', 'savings_percent', 'status']],
+            display_table,
+            column_config=LOG_COLUMN_CONFIG,
             use_container_width=True,
             height=400
         )
-    else:
-        st.info("No decisions logged yet. Trigger the scheduler to see data!")
-
-    st.markdown('</div>', unsafe_allow_html=True)
 
 # ============================================================================
 # PHASE 9: ADVANCED VISUALIZATIONS
 # ============================================================================
 
-def render_geographic_map(recent_logs):
-    """Render geographic heatmap of regions with carbon intensity"""
-    st.markdown('<div class="geo-map-container">', unsafe_allow_html=True)
-    st.markdown('<h3 class="chart-title">Global Carbon Intensity Map</h3>', unsafe_allow_html=True)
-
-    # Region coordinates
-    region_coords = {
-        'IN': {'lat': 20.5937, 'lon': 78.9629, 'name': 'India'},
-        'FI': {'lat': 61.9241, 'lon': 25.7482, 'name': 'Finland'},
-        'DE': {'lat': 51.1657, 'lon': 10.4515, 'name': 'Germany'},
-        'JP': {'lat': 36.2048, 'lon': 138.2529, 'name': 'Japan'},
-        'AU-NSW': {'lat': -31.8406, 'lon': 147.3222, 'name': 'Australia (NSW)'},
-        'BR-CS': {'lat': -15.8267, 'lon': -47.9218, 'name': 'Brazil (Central-South)'}
-    }
-
-    if not recent_logs.empty:
-        # Get latest carbon intensity for each region
-        latest_data = recent_logs.groupby('region').agg({
-            'carbon_intensity': 'last',
-            'timestamp': 'last'
-        }).reset_index()
-
-        # Create map data
-        map_data = []
-        for _, row in latest_data.iterrows():
-            if row['region'] in region_coords:
-                map_data.append({
-                    'region': row['region'],
-                    'name': region_coords[row['region']]['name'],
-                    'lat': region_coords[row['region']]['lat'],
-                    'lon': region_coords[row['region']]['lon'],
-                    'carbon': row['carbon_intensity'],
-                    'size': max(10, 100 - row['carbon_intensity'])  # Invert for visual
-                })
-
-        if map_data:
-            df_map = pd.DataFrame(map_data)
-
-            fig = px.scatter_geo(df_map,
-                lat='lat',
-                lon='lon',
-                size='size',
-                color='carbon',
-                hover_name='name',
-                hover_data={'carbon': ':.1f', 'lat': False, 'lon': False, 'size': False},
-                color_continuous_scale='RdYlGn_r',
-                size_max=50,
-                labels={'carbon': 'Carbon Intensity (gCO₂/kWh)'}
-            )
+# Region coordinates
+REGION_COORDS = {
+    'IN': {'lat': 20.5937, 'lon': 78.9629, 'name': 'India'},
+    'FI': {'lat': 61.9241, 'lon': 25.7482, 'name': 'Finland'},
+    'DE': {'lat': 51.1657, 'lon': 10.4515, 'name': 'Germany'},
+    'JP': {'lat': 36.2048, 'lon': 138.2529, 'name': 'Japan'},
+    'AU-NSW': {'lat': -31.8406, 'lon': 147.3222, 'name': 'Australia (NSW)'},
+    'BR-CS': {'lat': -15.8267, 'lon': -47.9218, 'name': 'Brazil (Central-South)'}
+}
+
+# Columnar copy of the region metadata, built once at import
+_REGION_TABLE = pa.table({
+    'region': pa.array(list(REGION_COORDS), pa.string()),
+    'name': pa.array([c['name'] for c in REGION_COORDS.values()], pa.string()),
+    'lat': pa.array([c['lat'] for c in REGION_COORDS.values()], pa.float64()),
+    'lon': pa.array([c['lon'] for c in REGION_COORDS.values()], pa.float64()),
+})
+_COORDS_DF = _REGION_TABLE.to_pandas()
+
+def _sort_and_indptr(df, key):
+    """Stable-sort df by key and return (sorted_df, unique_keys, indptr).
+
+    Rows for unique_keys[i] are sorted_df.iloc[indptr[i]:indptr[i + 1]], so
+    per-key reductions become slices or np.*.reduceat calls over one sort.
+    """
+    df = df.sort_values(key, kind='mergesort').reset_index(drop=True)
+    keys = df[key].to_numpy()
+    if len(keys) == 0:
+        return df, keys, np.zeros(1, dtype=np.intp)
+    indptr = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1], True])
+    return df, keys[indptr[:-1]], indptr
+
+@st.cache_data(ttl=60, max_entries=8, show_spinner=False)
+def _build_map_frame(fingerprint, _recent_logs):
+    """Per-region carbon summary for known regions with map coordinates (cached)"""
+    # Stable sort keeps each region's rows newest-first, as the logs arrive
+    logs, regions, indptr = _sort_and_indptr(_recent_logs[_recent_logs['region'].notna()], 'region')
+    starts = indptr[:-1]
+
+    # Missing readings are skipped for the latest/mean values but still count as decisions
+    carbon = logs['carbon_intensity'].to_numpy(dtype=float, na_value=np.nan)
+    valid = ~np.isnan(carbon)
+    row = np.arange(len(carbon))
+    first_valid = np.minimum.reduceat(np.where(valid, row, len(carbon)), starts)
+    n_valid = np.add.reduceat(valid, starts)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        carbon_mean = np.add.reduceat(np.where(valid, carbon, 0.0), starts) / n_valid
+
+    region_stats = pd.DataFrame({
+        'region': regions,
+        'carbon': np.append(carbon, np.nan)[first_valid],
+        'carbon_mean': carbon_mean,
+        'decisions': np.diff(indptr)
+    })
+
+    # Attach coordinates for known regions (inner join drops unknown ones)
+    df_map = region_stats.merge(_COORDS_DF, on='region', how='inner')
+    df_map['carbon_mean'] = df_map['carbon_mean'].round(1)
+    # Invert for visual; regions without a reading get the minimum size instead of NaN
+    df_map['size'] = np.maximum(10, np.nan_to_num(100 - df_map['carbon'].to_numpy(), nan=10))
+
+    return df_map[['region', 'name', 'lat', 'lon', 'carbon', 'carbon_mean', 'decisions', 'size']]
+
+@st.cache_data(ttl=60, max_entries=8, show_spinner=False)
+def _build_map_deck(map_key, _df_map):
+    """pydeck Deck for the map frame, keyed on its per-region readings (cached)"""
+    # Green (clean) -> red (carbon-heavy) fill, scaled over 0-800 gCO2/kWh;
+    # regions without a reading sit mid-scale rather than casting NaN to int
+    intensity = np.nan_to_num(np.clip(_df_map['carbon'].to_numpy() / 800, 0, 1), nan=0.5)
+    # Ship only the columns the layer and tooltip read; pydeck serializes every column
+    df_map = _df_map[['name', 'lat', 'lon', 'size', 'carbon', 'carbon_mean', 'decisions']].assign(
+        r=(255 * intensity).astype(int),
+        g=(255 * (1 - intensity)).astype(int)
+    )
 
-            fig.update_layout(
-                geo=dict(
-                    projection_type='natural earth',
-                    showland=True,
-                    landcolor='rgb(15, 15, 35)',
-                    oceancolor='rgb(10, 10, 25)',
-                    showocean=True,
-                    showcountries=True,
-                    countrycolor='rgb(0, 255, 255, 0.2)',
-                    bgcolor='rgba(0,0,0,0)'
-                ),
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                margin=dict(l=0, r=0, t=0, b=0),
-                height=400,
-                font=dict(color='#00ffaa', family='Rajdhani')
-            )
+    # deck.gl draws the points with WebGL instead of Plotly's SVG geo renderer
+    import pydeck as pdk
+
+    layer = pdk.Layer(
+        'ScatterplotLayer',
+        data=df_map,
+        get_position='[lon, lat]',
+        get_radius='size * 20000',
+        get_fill_color='[r, g, 80, 180]',
+        get_line_color=[0, 255, 255],
+        line_width_min_pixels=1,
+        stroked=True,
+        pickable=True
+    )
 
-            st.plotly_chart(fig, use_container_width=True)
+    return pdk.Deck(
+        layers=[layer],
+        initial_view_state=pdk.ViewState(latitude=20, longitude=0, zoom=0.8),
+        map_style='dark',
+        tooltip={'html': '<b>{name}</b><br/>Carbon Intensity: {carbon} gCO₂/kWh'
+                         '<br/>Average: {carbon_mean} gCO₂/kWh<br/>Decisions: {decisions}'}
+    )
+
+@st.fragment
+def render_geographic_map(recent_logs):
+    """Render geographic heatmap of regions with carbon intensity"""
+    with chart_container("Global Carbon Intensity Map"):
+        if recent_logs.empty:
+            st.info("No data available - trigger scheduler to see regions")
+            return
+
+        df_map = _build_map_frame(_df_fingerprint(recent_logs), recent_logs)
+
+        if not df_map.empty:
+            # Tooltip fields are part of the key so a changed average rebuilds the deck
+            map_key = tuple(zip(df_map['region'], df_map['carbon'].round(1),
+                                df_map['carbon_mean'], df_map['decisions']))
+            st.pydeck_chart(_build_map_deck(map_key, df_map), use_container_width=True)
         else:
             st.info("No region data available for map visualization")
-    else:
-        st.info("No data available - trigger scheduler to see regions")
 
-    st.markdown('</div>', unsafe_allow_html=True)
+ENERGY_MIX_MAX_POINTS = 1000
+
+@st.cache_data(ttl=300, max_entries=8, show_spinner=False)
+def _cached_ai_insights(fingerprint, _recent_logs, days):
+    """AI insights keyed on the logs fingerprint so new decisions invalidate the entry"""
+    return get_ai_insights(_recent_logs.copy(), days)
+
+@st.cache_data(ttl=300, max_entries=8, show_spinner=False)
+def _build_energy_mix_figure(fingerprint, _energy_mix_data):
+    """Energy mix area chart keyed on the data fingerprint, or None when there is no data"""
+    energy_mix_data = _energy_mix_data
+
+    if energy_mix_data.empty or 'renewable_pct' not in energy_mix_data.columns:
+        return None
+
+    # Downsample long windows so only what the chart can show is sent.
+    # Fossil share is 100 - renewable, so both traces share the same points.
+    keep = lttb_indices(
+        energy_mix_data['timestamp'].to_numpy(),
+        energy_mix_data['renewable_pct'].to_numpy(),
+        ENERGY_MIX_MAX_POINTS
+    )
+    energy_mix_data = energy_mix_data.iloc[keep].copy()
+    energy_mix_data['fossil_pct'] = 100 - energy_mix_data['renewable_pct']
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Scattergl(
+        x=energy_mix_data['timestamp'],
+        y=energy_mix_data['renewable_pct'],
+        name='Renewable Energy',
+        fill='tonexty',
+        fillcolor='rgba(0, 255, 136, 0.3)',
+        line=dict(color='#00ff88', width=2),
+        hovertemplate='%{y:.1f}% Renewable<extra></extra>'
+    ))
+
+    fig.add_trace(go.Scattergl(
+        x=energy_mix_data['timestamp'],
+        y=energy_mix_data['fossil_pct'],
+        name='Carbon-Based Energy',
+        fill='tozeroy',
+        fillcolor='rgba(255, 99, 71, 0.3)',
+        line=dict(color='#ff6347', width=2),
+        hovertemplate='%{y:.1f}% Fossil<extra></extra>'
+    ))
 
+    fig.update_layout(
+        **_TRANSPARENT_BG,
+        font=dict(color='#ffffff', family='Rajdhani'),
+        xaxis=dict(_GRID_AXIS, title='Time', title_font=dict(color='#00ffaa')),
+        yaxis=dict(_GRID_AXIS, title='Percentage (%)', title_font=dict(color='#00ffaa'), range=[0, 100]),
+        hovermode='x unified',
+        height=350,
+        margin=dict(l=50, r=20, t=20, b=50),
+        uirevision='energy_mix',
+        legend=dict(
+            orientation='h',
+            yanchor='bottom',
+            y=1.02,
+            xanchor='right',
+            x=1,
+            font=dict(color='#ffffff')
+        )
+    )
+
+    return fig
+
+@st.fragment
 def render_energy_mix_chart(days=7):
     """Render stacked area chart showing energy mix over time"""
-    st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-    st.markdown('<h3 class="chart-title">Renewable vs Carbon Energy Mix Trend</h3>', unsafe_allow_html=True)
+    with chart_container("Renewable vs Carbon Energy Mix Trend"):
+        try:
+            # get_energy_mix_data follows the data caches, so Refresh Data and
+            # new decisions change the fingerprint and rebuild the figure
+            energy_mix_data = get_energy_mix_data(days)
+            fig = _build_energy_mix_figure(_df_fingerprint(energy_mix_data), energy_mix_data)
+
+            if fig is not None:
+                st.plotly_chart(fig, use_container_width=True, key="energy_mix_chart")
+            else:
+                st.info("Energy mix data not available - using carbon intensity as proxy")
+        except Exception as e:
+            st.warning(f"Energy mix visualization unavailable: {str(e)}")
+
+# Insight card markup, built once at import and filled with str.format per rerun
+_GREENEST_CARD = (
+    '<div class="insight-card">'
+    '<div class="insight-title">Greenest Region Analysis</div>'
+    '<div class="insight-text">'
+    '<span class="insight-metric">{greenest_region}</span> has been selected '
+    '<span class="insight-metric">{greenest_frequency:.1f}%</span> '
+    'of the time, maintaining consistently low carbon intensity.'
+    '</div></div>'
+)
+_TREND_CARD = (
+    '<div class="insight-card">'
+    '<div class="insight-title">Carbon Savings Trend</div>'
+    '<div class="insight-text">'
+    'Carbon intensity <span class="insight-metric">{trend_direction}</span> '
+    'by <span class="insight-metric">{trend_change:.1f}%</span> '
+    'this week compared to baseline.'
+    '</div></div>'
+)
+_PERFORMANCE_CARD = (
+    '<div class="insight-card">'
+    '<div class="insight-title">Optimization Performance</div>'
+    '<div class="insight-text">'
+    'Average savings of <span class="insight-metric">{avg_savings:.1f} gCO₂</span> '
+    'per decision, achieving <span class="insight-metric">{savings_percent:.1f}%</span> '
+    'reduction target.'
+    '</div></div>'
+)
+_PEAK_CARD = (
+    '<div class="insight-card">'
+    '<div class="insight-title">Peak Efficiency Time</div>'
+    '<div class="insight-text">'
+    'Best carbon efficiency observed during <span class="insight-metric">{peak_time}</span> '
+    'with average intensity below '
+    '<span class="insight-metric">{peak_carbon:.0f} gCO₂/kWh</span>.'
+    '</div></div>'
+)
+_CONFIDENCE_CARD = (
+    '<div class="insight-card">'
+    '<div class="insight-title">Decision Confidence</div>'
+    '<div class="insight-text">'
+    '<span class="insight-metric">{confidence_score:.0f}%</span> '
+    'confidence in region selection based on '
+    '<span class="insight-metric">{total_decisions}</span> '
+    'historical decisions analyzed.'
+    '</div></div>'
+)
+
+def render_ai_insights_section(recent_logs, stats, days=7):
+    """Render AI-powered insights and trend analysis"""
+    st.markdown(
+        '<div class="section-divider"></div>'
+        '<h2 class="chart-title" style="text-align: center; margin: 2rem 0;">AI Insights & Predictions</h2>',
+        unsafe_allow_html=True
+    )
 
     try:
-        energy_mix_data = get_energy_mix_data(days)
-
-        if not energy_mix_data.empty and 'renewable_pct' in energy_mix_data.columns:
-            energy_mix_data['fossil_pct'] = 100 - energy_mix_data['renewable_pct']
-
-            fig = go.Figure()
-
-            fig.add_trace(go.Scatter(
-                x=energy_mix_data['timestamp'],
-                y=energy_mix_data['renewable_pct'],
-                name='Renewable Energy',
-                fill='tonexty',
-                fillcolor='rgba(0, 255, 136, 0.3)',
-                line=dict(color='#00ff88', width=2),
-                hovertemplate='%{y:.1f}% Renewable<extra></extra>'
-            ))
-
-            fig.add_trace(go.Scatter(
-                x=energy_mix_data['timestamp'],
-                y=energy_mix_data['fossil_pct'],
-                name='Carbon-Based Energy',
-                fill='tozeroy',
-                fillcolor='rgba(255, 99, 71, 0.3)',
-                line=dict(color='#ff6347', width=2),
-                hovertemplate='%{y:.1f}% Fossil<extra></extra>'
-            ))
-
-            fig.update_layout(
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#ffffff', family='Rajdhani'),
-                xaxis=dict(
-                    showgrid=True,
-                    gridcolor='rgba(0, 255, 255, 0.1)',
-                    title='Time',
-                    title_font=dict(color='#00ffaa')
-                ),
-                yaxis=dict(
-                    showgrid=True,
-                    gridcolor='rgba(0, 255, 255, 0.1)',
-                    title='Percentage (%)',
-                    title_font=dict(color='#00ffaa'),
-                    range=[0, 100]
-                ),
-                hovermode='x unified',
-                height=350,
-                margin=dict(l=50, r=20, t=20, b=50),
-                legend=dict(
-                    orientation='h',
-                    yanchor='bottom',
-                    y=1.02,
-                    xanchor='right',
-                    x=1,
-                    font=dict(color='#ffffff')
-                )
-            )
+        insights = _cached_ai_insights(_df_fingerprint(recent_logs), recent_logs, days)
+
+        # All five cards in one element; the CSS grid centers the odd card out
+        cards = (
+            _GREENEST_CARD.format(
+                greenest_region=insights.get('greenest_region', 'N/A'),
+                greenest_frequency=insights.get('greenest_frequency', 0)
+            ),
+            _TREND_CARD.format(
+                trend_direction=insights.get('trend_direction', 'stable'),
+                trend_change=abs(insights.get('trend_change', 0))
+            ),
+            _PERFORMANCE_CARD.format(
+                avg_savings=insights.get('avg_savings', 0),
+                savings_percent=stats.get('savings_percent', 0)
+            ),
+            _PEAK_CARD.format(
+                peak_time=insights.get('peak_time', 'N/A'),
+                peak_carbon=insights.get('peak_carbon', 0)
+            ),
+            _CONFIDENCE_CARD.format(
+                confidence_score=insights.get('confidence_score', 95),
+                total_decisions=insights.get('total_decisions', 0)
+            ),
+        )
+        st.markdown(f'<div class="insight-grid">{"".join(cards)}</div>', unsafe_allow_html=True)
 
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("Energy mix data not available - using carbon intensity as proxy")
     except Exception as e:
-        st.warning(f"Energy mix visualization unavailable: {str(e)}")
+        st.info(f"Generating AI insights... {str(e)}")
 
-    st.markdown('</div>', unsafe_allow_html=True)
 
-def render_ai_insights_section(recent_logs, stats, days=7):
-    """Render AI-powered insights and trend analysis"""
-    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
-    st.markdown('<h2 class="chart-title" style="text-align: center; margin: 2rem 0;">AI Insights & Predictions</h2>', unsafe_allow_html=True)
+# Above this many points scatter traces switch from SVG to WebGL rendering
+WEBGL_POINT_THRESHOLD = 200
+
+
+def _scatter_cls(n_points):
+    """Pick go.Scattergl for large traces and go.Scatter for small ones"""
+    return go.Scattergl if n_points > WEBGL_POINT_THRESHOLD else go.Scatter
+
+
+@st.cache_resource(show_spinner=False)
+def _get_scheduler():
+    """Create the predictive scheduler once per server process (shared, read-only)"""
+    return SimplePredictiveScheduler()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _carbon_snapshot():
+    """Live carbon intensity per zone, fetched at most once every five minutes"""
+    return _get_scheduler().fetch_carbon_data()
+
+
+@st.cache_data(ttl=600, max_entries=256, show_spinner=False)
+def _run_optimizer(w_carbon, w_latency, w_cost):
+    """Optimizer result per rounded weight set, shared across sessions for 10 minutes"""
+    result = _get_scheduler().select_optimal_region(
+        w_carbon=w_carbon, w_latency=w_latency, w_cost=w_cost,
+        carbon_data=_carbon_snapshot()
+    )
+    if not result['success']:
+        # Raising keeps a failed carbon fetch out of the cache
+        raise RuntimeError(result.get('error', 'Optimization failed'))
+    return result
+
 
+def _optimizer_result(weights):
+    """Cached optimizer result for a weight tuple, or None if the run failed"""
     try:
-        insights = get_ai_insights(recent_logs, days)
+        return _run_optimizer(*weights)
+    except RuntimeError:
+        return None
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _pareto(objective1, objective2):
+    """Pareto frontier for two objectives, refreshed at most every five minutes"""
+    return _get_scheduler().generate_pareto_frontier(
+        objective1=objective1,
+        objective2=objective2,
+        carbon_data=_carbon_snapshot()
+    )
 
-        # First row - 2 cards
-        col1, col2 = st.columns(2)
 
-        with col1:
-            st.markdown(f"""
-            <div class="insight-card">
-                <div class="insight-title">Greenest Region Analysis</div>
-                <div class="insight-text">
-                    <span class="insight-metric">{insights.get('greenest_region', 'N/A')}</span>
-                    has been selected
-                    <span class="insight-metric">{insights.get('greenest_frequency', 0):.1f}%</span>
-                    of the time, maintaining consistently low carbon intensity.
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+@st.cache_data(max_entries=64, show_spinner=False)
+def _render_metric_grid(items):
+    """Build one metric-grid HTML block from a tuple of (label, value) pairs"""
+    cards = "".join(
+        f'<div class="metric-card"><div class="metric-label">{label}</div>'
+        f'<div class="metric-value">{value}</div></div>'
+        for label, value in items
+    )
+    return f'<div class="metric-grid">{cards}</div>'
 
-        with col2:
-            st.markdown(f"""
-            <div class="insight-card">
-                <div class="insight-title">Carbon Savings Trend</div>
-                <div class="insight-text">
-                    Carbon intensity
-                    <span class="insight-metric">{insights.get('trend_direction', 'stable')}</span>
-                    by <span class="insight-metric">{abs(insights.get('trend_change', 0)):.1f}%</span>
-                    this week compared to baseline.
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
 
-        # Second row - 2 cards
-        col3, col4 = st.columns(2)
+def _record_arrays(records, fields):
+    """Column-wise NumPy arrays from a list of dicts, so Plotly skips per-trace list validation"""
+    return {field: np.array([r[field] for r in records]) for field in fields}
 
-        with col3:
-            st.markdown(f"""
-            <div class="insight-card">
-                <div class="insight-title">Optimization Performance</div>
-                <div class="insight-text">
-                    Average savings of
-                    <span class="insight-metric">{insights.get('avg_savings', 0):.1f} gCO₂</span>
-                    per decision, achieving
-                    <span class="insight-metric">{stats.get('savings_percent', 0):.1f}%</span>
-                    reduction target.
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
 
-        with col4:
-            st.markdown(f"""
-            <div class="insight-card">
-                <div class="insight-title">Peak Efficiency Time</div>
-                <div class="insight-text">
-                    Best carbon efficiency observed during
-                    <span class="insight-metric">{insights.get('peak_time', 'N/A')}</span>
-                    with average intensity below
-                    <span class="insight-metric">{insights.get('peak_carbon', 0):.0f} gCO₂/kWh</span>.
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        # Third row - 1 card (Decision Confidence centered)
-        col5, col6, col7 = st.columns([1, 2, 1])
-
-        with col6:
-            st.markdown(f"""
-            <div class="insight-card">
-                <div class="insight-title">Decision Confidence</div>
-                <div class="insight-text">
-                    <span class="insight-metric">{insights.get('confidence_score', 95):.0f}%</span>
-                    confidence in region selection based on
-                    <span class="insight-metric">{insights.get('total_decisions', 0)}</span>
-                    historical decisions analyzed.
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+CANDIDATE_FIELDS = ('region', 'carbon_intensity', 'latency', 'cost', 'score')
 
-    except Exception as e:
-        st.info(f"Generating AI insights... {str(e)}")
 
+@st.cache_data(max_entries=16, show_spinner=False)
+def _build_candidates_fig(candidates_key, _candidates):
+    """Score bar chart for the optimizer candidates (cached per candidate set)"""
+    cols = _record_arrays(_candidates, ('region', 'score'))
+    scores = cols['score']
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=cols['region'],
+        y=scores,
+        text=np.char.mod('%.3f', scores),
+        textposition="outside",
+        marker=dict(
+            color=scores,
+            colorscale="Viridis_r",
+            showscale=False
+        )
+    ))
+
+    fig.update_layout(
+        xaxis_title="",
+        yaxis_title="Score",
+        **_TRANSPARENT_BG,
+        font=dict(color="white", family="Orbitron", size=10),
+        height=320,
+        margin=dict(l=40, r=20, t=20, b=40),
+        xaxis=dict(tickangle=-45),
+        uirevision='opt'
+    )
+
+    return fig
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _build_pareto_fig(candidates_key, selected_region, pareto_key, _candidates, _pareto_points):
+    """Carbon vs latency Pareto chart with the selected region highlighted (cached)"""
+    cols = _record_arrays(_candidates, ('region', 'carbon_intensity', 'latency'))
+    frontier = _record_arrays(_pareto_points, ('region', 'carbon', 'latency'))
+
+    fig_pareto = go.Figure()
+
+    # All regions
+    fig_pareto.add_trace(_scatter_cls(len(_candidates))(
+        x=cols['carbon_intensity'],
+        y=cols['latency'],
+        mode='markers',
+        name='All Regions',
+        marker=dict(size=12, color='rgba(127, 0, 255, 0.5)'),
+        text=cols['region'],
+        hovertemplate='<b>%{text}</b><br>Carbon: %{x:.0f} gCO₂/kWh<br>Latency: %{y}ms<extra></extra>'
+    ))
+
+    # Pareto frontier
+    fig_pareto.add_trace(_scatter_cls(len(_pareto_points))(
+        x=frontier['carbon'],
+        y=frontier['latency'],
+        mode='lines+markers',
+        name='Pareto Frontier',
+        line=dict(color='#00d4ff', width=3),
+        marker=dict(size=15, color='#00d4ff', symbol='star'),
+        text=frontier['region'],
+        hovertemplate='<b>%{text}</b><br>Carbon: %{x:.0f} gCO₂/kWh<br>Latency: %{y}ms<extra></extra>'
+    ))
+
+    # Highlight selected region
+    selected_row = next(c for c in _candidates if c['region'] == selected_region)
+    fig_pareto.add_trace(go.Scatter(
+        x=[selected_row['carbon_intensity']],
+        y=[selected_row['latency']],
+        mode='markers',
+        name='Selected',
+        marker=dict(size=20, color='#ff00ff', symbol='diamond', line=dict(color='white', width=2)),
+        hovertemplate=f"<b>{selected_region} (Selected)</b><br>Carbon: {selected_row['carbon_intensity']:.0f} gCO₂/kWh<br>Latency: {selected_row['latency']}ms<extra></extra>"
+    ))
+
+    fig_pareto.update_layout(
+        title=dict(
+            text="Carbon Intensity vs Network Latency",
+            font=dict(size=16, color='white', family='Orbitron')
+        ),
+        xaxis_title="Carbon Intensity (gCO₂/kWh)",
+        yaxis_title="Network Latency (ms)",
+        **_TRANSPARENT_BG,
+        font=dict(color='white', family='Orbitron'),
+        height=450,
+        hovermode='closest',
+        uirevision='opt',
+        showlegend=True,
+        legend=dict(
+            x=0.98,
+            y=0.98,
+            xanchor='right',
+            yanchor='top',
+            bgcolor='rgba(0,0,0,0.7)',
+            bordercolor='rgba(0, 212, 255, 0.5)',
+            borderwidth=2
+        ),
+        xaxis=dict(
+            gridcolor='rgba(0, 212, 255, 0.1)',
+            showgrid=True
+        ),
+        yaxis=dict(
+            gridcolor='rgba(0, 212, 255, 0.1)',
+            showgrid=True
+        )
+    )
+
+    return fig_pareto
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _build_analytics_fig(candidates_key, selected_region, _candidates):
+    """Scores and carbon/cost trade-off subplots for the optimizer (cached)"""
+    from plotly.subplots import make_subplots
+
+    cols = _record_arrays(_candidates, CANDIDATE_FIELDS)
+    regions = cols['region']
+    scores = cols['score']
+    selected_row = next(c for c in _candidates if c['region'] == selected_region)
 
+    fig_analytics = make_subplots(
+        rows=1, cols=2, horizontal_spacing=0.14,
+        subplot_titles=("Multi-Objective Scores", "Carbon vs Cost Trade-off")
+    )
+    fig_analytics.add_trace(go.Bar(
+        x=regions,
+        y=scores,
+        text=np.char.mod('%.3f', scores),
+        textposition='outside',
+        marker=dict(color=scores, colorscale='Viridis_r', showscale=True,
+                  colorbar=dict(title="Score", x=0.43, len=0.9))
+    ), row=1, col=1)
+    fig_analytics.add_trace(_scatter_cls(len(_candidates))(
+        x=cols['carbon_intensity'], y=cols['cost'],
+        mode='markers+text', text=regions, textposition='top center',
+        marker=dict(size=15, color=cols['latency'], colorscale='Plasma', showscale=True,
+                  colorbar=dict(title="Latency<br>(ms)", x=1.02, len=0.9),
+                  line=dict(color='white', width=1)),
+        hovertemplate='<b>%{text}</b><br>Carbon: %{x:.0f} gCO₂/kWh<br>Cost: $%{y:.4f}<extra></extra>'
+    ), row=1, col=2)
+    fig_analytics.add_trace(go.Scatter(
+        x=[selected_row['carbon_intensity']], y=[selected_row['cost']], mode='markers',
+        marker=dict(size=25, color='#ff00ff', symbol='diamond', line=dict(color='white', width=2))
+    ), row=1, col=2)
+    fig_analytics.update_layout(
+        **_TRANSPARENT_BG,
+        font=dict(color='white', family='Orbitron', size=11), height=380,
+        margin=dict(l=50, r=80, t=50, b=50), showlegend=False,
+        uirevision='opt'
+    )
+    fig_analytics.update_annotations(font=dict(color='#00ffaa', size=14))
+    fig_analytics.update_xaxes(gridcolor='rgba(255,255,255,0.1)')
+    fig_analytics.update_yaxes(gridcolor='rgba(255,255,255,0.1)')
+    fig_analytics.update_xaxes(title_text="Region", tickangle=-45, row=1, col=1)
+    fig_analytics.update_yaxes(title_text="Optimization Score", row=1, col=1)
+    fig_analytics.update_xaxes(title_text="Carbon Intensity (gCO₂/kWh)", row=1, col=2)
+    fig_analytics.update_yaxes(title_text="Cost ($/vCPU-hour)", row=1, col=2)
+
+    return fig_analytics
+
+
+@st.fragment
 def render_multi_objective_optimizer():
     """
     Render Multi-Objective Optimization Section (clean version)
     3-column layout: Objective Weights | Optimal Region | Candidates Comparison
     No duplicate boxes, no empty containers, clean layout.
+    Runs as a fragment, so its sliders and button rerun only this section.
     """
-    import streamlit as st
-    import pandas as pd
-    import plotly.graph_objects as go
-
     try:
         # Divider + Title
-        st.markdown('<div class="neon-divider"></div>', unsafe_allow_html=True)
-        st.markdown('<div class="section-title">Optimize Region Selection</div>', unsafe_allow_html=True)
-
-        # Load scheduler
-        from predictor import SimplePredictiveScheduler
-        scheduler = SimplePredictiveScheduler()
+        st.markdown(
+            '<div class="neon-divider"></div>'
+            '<div class="section-title">Optimize Region Selection</div>',
+            unsafe_allow_html=True
+        )
 
         # ---------------------- 3 COLUMN GRID ---------------------- #
         col1, col2, col3 = st.columns([1.3, 1, 1.2])
@@ -1464,23 +1964,30 @@ def render_multi_objective_optimizer():
         with col1:
             st.markdown("#### Objective Weights")
 
-            w_carbon = st.slider(
-                "Carbon Weight", 0.0, 1.0, 0.5, 0.1,
-                help="Higher values prioritize lower carbon intensity"
-            )
+            # Slider moves are batched until the form is submitted
+            with st.form("optim_form", border=False):
+                w_carbon = st.slider(
+                    "Carbon Weight", 0.0, 1.0, 0.5, 0.1,
+                    help="Higher values prioritize lower carbon intensity"
+                )
 
-            w_latency = st.slider(
-                "Latency Weight", 0.0, 1.0, 0.3, 0.1,
-                help="Higher values prioritize lower network latency"
-            )
+                w_latency = st.slider(
+                    "Latency Weight", 0.0, 1.0, 0.3, 0.1,
+                    help="Higher values prioritize lower network latency"
+                )
 
-            w_cost = st.slider(
-                "Cost Weight", 0.0, 1.0, 0.2, 0.1,
-                help="Higher values prioritize lower regional costs"
-            )
+                w_cost = st.slider(
+                    "Cost Weight", 0.0, 1.0, 0.2, 0.1,
+                    help="Higher values prioritize lower regional costs"
+                )
 
-            # Normalized weights
+                submitted = st.form_submit_button(
+                    " Optimize Region Selection", type="primary", use_container_width=True
+                )
+
+            # Normalized weights (all zero when every slider is at 0)
             total = w_carbon + w_latency + w_cost
+            norm_carbon = norm_latency = norm_cost = 0.0
             if total > 0:
                 norm_carbon = (w_carbon / total) * 100
                 norm_latency = (w_latency / total) * 100
@@ -1500,18 +2007,24 @@ def render_multi_objective_optimizer():
                 </div>
                 """, unsafe_allow_html=True)
 
-            # Run optimizer
-            if st.button(" Optimize Region Selection", type="primary", use_container_width=True):
+            # Run optimizer; the session keeps only the weights, the result lives in the cache
+            if submitted:
+                weights = (round(w_carbon, 2), round(w_latency, 2), round(w_cost, 2))
                 with st.spinner("Computing optimal region..."):
-                    result = scheduler.select_optimal_region(
-                        w_carbon=w_carbon, w_latency=w_latency, w_cost=w_cost
-                    )
-
-                    if result["success"]:
-                        st.session_state.optimization_result = result
+                    if _optimizer_result(weights) is not None:
+                        st.session_state.optimization_weights = weights
                     else:
                         st.error("Optimization failed.")
 
+        # One sorted candidate list shared by every chart and panel below
+        weights = st.session_state.optimization_weights
+        result = _optimizer_result(weights) if weights is not None else None
+        if result is not None:
+            candidates = sorted(result['all_candidates'], key=itemgetter('score'))
+            candidates_key = tuple(
+                (c['region'], c['carbon_intensity'], c['latency'], c['cost'], c['score'])
+                for c in candidates
+            )
 
         # ------------------------------------------------------------ #
         # COLUMN 2: OPTIMAL REGION CARD
@@ -1519,11 +2032,9 @@ def render_multi_objective_optimizer():
         with col2:
             st.markdown("#### Optimal Region")
 
-            if "optimization_result" in st.session_state:
-                result = st.session_state.optimization_result
-
-                # Card
-                st.markdown(f"""
+            if result is not None:
+                # Card and metrics flushed as one element
+                card = f"""
                 <div style="background: linear-gradient(135deg, #7f00ff, #00d4ff);
                            border-radius: 15px; padding: 25px; margin-bottom: 15px;
                            text-align: center; box-shadow: 0 8px 20px rgba(0, 212, 255, 0.3);">
@@ -1534,12 +2045,13 @@ def render_multi_objective_optimizer():
                         Score: <strong style="font-size: 1.2rem;">{result['score']:.3f}</strong>
                     </div>
                 </div>
-                """, unsafe_allow_html=True)
-
-                # Metrics
-                st.metric("Carbon", f"{result['carbon_intensity']:.0f} gCO₂/kWh")
-                st.metric("Latency", f"{result['latency']}ms")
-                st.metric("Cost", f"${result['cost']:.4f}")
+                """
+                metrics = _render_metric_grid((
+                    ("Carbon", f"{result['carbon_intensity']:.0f} gCO₂/kWh"),
+                    ("Latency", f"{result['latency']}ms"),
+                    ("Cost", f"${result['cost']:.4f}"),
+                ))
+                st.markdown(card + metrics, unsafe_allow_html=True)
 
             else:
                 st.info("Adjust weights and click *Optimize Region Selection* to compute.")
@@ -1551,128 +2063,29 @@ def render_multi_objective_optimizer():
         with col3:
             st.markdown("#### All Candidates Comparison")
 
-            if "optimization_result" in st.session_state:
-                result = st.session_state.optimization_result
-
-                df = pd.DataFrame(result["all_candidates"])
-                df = df.sort_values("score")
-
-                fig = go.Figure()
-                fig.add_trace(go.Bar(
-                    x=df["region"],
-                    y=df["score"],
-                    text=df["score"].apply(lambda x: f"{x:.3f}"),
-                    textposition="outside",
-                    marker=dict(
-                        color=df["score"],
-                        colorscale="Viridis_r",
-                        showscale=False
-                    )
-                ))
-
-                fig.update_layout(
-                    xaxis_title="",
-                    yaxis_title="Score",
-                    plot_bgcolor="rgba(0,0,0,0)",
-                    paper_bgcolor="rgba(0,0,0,0)",
-                    font=dict(color="white", family="Orbitron", size=10),
-                    height=320,
-                    margin=dict(l=40, r=20, t=20, b=40),
-                    xaxis=dict(tickangle=-45)
-                )
-
-                st.plotly_chart(fig, use_container_width=True)
+            if result is not None:
+                fig = _build_candidates_fig(candidates_key, candidates)
+                st.plotly_chart(fig, use_container_width=True, key="candidates_chart")
 
             else:
                 st.info("Comparison chart will appear here.")
 
         # Pareto Frontier Section (Full Width Below) - only after optimization
-        if 'optimization_result' in st.session_state:
-            result = st.session_state.optimization_result
-
-            st.markdown('<div class="neon-divider" style="margin-top: 30px;"></div>', unsafe_allow_html=True)
-            st.markdown('<div class="section-title">Pareto Frontier</div>', unsafe_allow_html=True)
+        if result is not None:
+            st.markdown(
+                '<div class="neon-divider" style="margin-top: 30px;"></div>'
+                '<div class="section-title">Pareto Frontier</div>',
+                unsafe_allow_html=True
+            )
 
             # Generate Pareto frontier
-            pareto_points = scheduler.generate_pareto_frontier(
-                objective1='carbon',
-                objective2='latency'
-            )
+            pareto_points = _pareto('carbon', 'latency')
+            pareto_key = tuple((p['region'], p['carbon'], p['latency']) for p in pareto_points)
 
             if pareto_points:
-                # Create Pareto plot
-                all_points_df = pd.DataFrame(result['all_candidates'])
-                pareto_df = pd.DataFrame(pareto_points)
-
-                fig_pareto = go.Figure()
-
-                # All regions
-                fig_pareto.add_trace(go.Scatter(
-                    x=all_points_df['carbon_intensity'],
-                    y=all_points_df['latency'],
-                    mode='markers',
-                    name='All Regions',
-                    marker=dict(size=12, color='rgba(127, 0, 255, 0.5)'),
-                    text=all_points_df['region'],
-                    hovertemplate='<b>%{text}</b><br>Carbon: %{x:.0f} gCO₂/kWh<br>Latency: %{y}ms<extra></extra>'
-                ))
-
-                # Pareto frontier
-                fig_pareto.add_trace(go.Scatter(
-                    x=pareto_df['carbon'],
-                    y=pareto_df['latency'],
-                    mode='lines+markers',
-                    name='Pareto Frontier',
-                    line=dict(color='#00d4ff', width=3),
-                    marker=dict(size=15, color='#00d4ff', symbol='star'),
-                    text=pareto_df['region'],
-                    hovertemplate='<b>%{text}</b><br>Carbon: %{x:.0f} gCO₂/kWh<br>Latency: %{y}ms<extra></extra>'
-                ))
-
-                # Highlight selected region
-                selected_row = all_points_df[all_points_df['region'] == result['region']].iloc[0]
-                fig_pareto.add_trace(go.Scatter(
-                    x=[selected_row['carbon_intensity']],
-                    y=[selected_row['latency']],
-                    mode='markers',
-                    name='Selected',
-                    marker=dict(size=20, color='#ff00ff', symbol='diamond', line=dict(color='white', width=2)),
-                    hovertemplate=f"<b>{result['region']} (Selected)</b><br>Carbon: {selected_row['carbon_intensity']:.0f} gCO₂/kWh<br>Latency: {selected_row['latency']}ms<extra></extra>"
-                ))
-
-                fig_pareto.update_layout(
-                    title=dict(
-                        text="Carbon Intensity vs Network Latency",
-                        font=dict(size=16, color='white', family='Orbitron')
-                    ),
-                    xaxis_title="Carbon Intensity (gCO₂/kWh)",
-                    yaxis_title="Network Latency (ms)",
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(color='white', family='Orbitron'),
-                    height=450,
-                    hovermode='closest',
-                    showlegend=True,
-                    legend=dict(
-                        x=0.98,
-                        y=0.98,
-                        xanchor='right',
-                        yanchor='top',
-                        bgcolor='rgba(0,0,0,0.7)',
-                        bordercolor='rgba(0, 212, 255, 0.5)',
-                        borderwidth=2
-                    ),
-                    xaxis=dict(
-                        gridcolor='rgba(0, 212, 255, 0.1)',
-                        showgrid=True
-                    ),
-                    yaxis=dict(
-                        gridcolor='rgba(0, 212, 255, 0.1)',
-                        showgrid=True
-                    )
-                )
-
-                st.plotly_chart(fig_pareto, use_container_width=True)
+                fig_pareto = _build_pareto_fig(candidates_key, result['region'], pareto_key,
+                                               candidates, pareto_points)
+                st.plotly_chart(fig_pareto, use_container_width=True, key="pareto_chart")
 
                 st.markdown("""
                 <div style="background: rgba(127, 0, 255, 0.1); border-radius: 10px; padding: 15px; margin-top: 15px;
@@ -1685,70 +2098,39 @@ def render_multi_objective_optimizer():
                 """, unsafe_allow_html=True)
 
             # Multi-Objective Analytics - TWO CHARTS ONLY, NO CONTAINERS
-            st.markdown('<div class="neon-divider" style="margin-top: 35px;"></div>', unsafe_allow_html=True)
-            st.markdown('<div class="section-title">Multi-Objective Analytics</div>', unsafe_allow_html=True)
-
-            col1, col2 = st.columns([1, 1])
-
-            with col1:
-                st.markdown("#### Multi-Objective Scores")
-                candidates_df = pd.DataFrame(result['all_candidates']).sort_values('score')
-
-                fig_scores = go.Figure()
-                fig_scores.add_trace(go.Bar(
-                    x=candidates_df['region'],
-                    y=candidates_df['score'],
-                    text=candidates_df['score'].apply(lambda x: f'{x:.3f}'),
-                    textposition='outside',
-                    marker=dict(color=candidates_df['score'], colorscale='Viridis_r', showscale=True,
-                              colorbar=dict(title="Score", x=1.15))
-                ))
-                fig_scores.update_layout(
-                    xaxis_title="Region", yaxis_title="Optimization Score",
-                    plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(color='white', family='Orbitron', size=11), height=350,
-                    margin=dict(l=50, r=80, t=30, b=50),
-                    xaxis=dict(tickangle=-45, gridcolor='rgba(255,255,255,0.1)'),
-                    yaxis=dict(gridcolor='rgba(255,255,255,0.1)')
-                )
-                st.plotly_chart(fig_scores, use_container_width=True)
-
-            with col2:
-                st.markdown("#### Carbon vs Cost Trade-off")
-
-                fig_tradeoff = go.Figure()
-                fig_tradeoff.add_trace(go.Scatter(
-                    x=candidates_df['carbon_intensity'], y=candidates_df['cost'],
-                    mode='markers+text', text=candidates_df['region'], textposition='top center',
-                    marker=dict(size=15, color=candidates_df['latency'], colorscale='Plasma', showscale=True,
-                              colorbar=dict(title="Latency<br>(ms)", x=1.15), line=dict(color='white', width=1)),
-                    hovertemplate='<b>%{text}</b><br>Carbon: %{x:.0f} gCO₂/kWh<br>Cost: $%{y:.4f}<extra></extra>'
-                ))
-                selected_row = candidates_df[candidates_df['region'] == result['region']].iloc[0]
-                fig_tradeoff.add_trace(go.Scatter(
-                    x=[selected_row['carbon_intensity']], y=[selected_row['cost']], mode='markers',
-                    marker=dict(size=25, color='#ff00ff', symbol='diamond', line=dict(color='white', width=2)),
-                    showlegend=False
-                ))
-                fig_tradeoff.update_layout(
-                    xaxis_title="Carbon Intensity (gCO₂/kWh)", yaxis_title="Cost ($/vCPU-hour)",
-                    plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(color='white', family='Orbitron', size=11), height=350,
-                    margin=dict(l=50, r=80, t=30, b=50),
-                    xaxis=dict(gridcolor='rgba(255,255,255,0.1)'),
-                    yaxis=dict(gridcolor='rgba(255,255,255,0.1)'), showlegend=False
-                )
-                st.plotly_chart(fig_tradeoff, use_container_width=True)
+            st.markdown(
+                '<div class="neon-divider" style="margin-top: 35px;"></div>'
+                '<div class="section-title">Multi-Objective Analytics</div>',
+                unsafe_allow_html=True
+            )
+
+            # Scores and trade-off share one figure so they render in a single chart
+            fig_analytics = _build_analytics_fig(candidates_key, result['region'], candidates)
+            st.plotly_chart(fig_analytics, use_container_width=True, key="analytics_chart")
 
             # Insights Panel
-            st.markdown('<div class="neon-divider" style="margin-top: 35px;"></div>', unsafe_allow_html=True)
-            st.markdown('<div class="section-title">Candidate Region Comparison</div>', unsafe_allow_html=True)
+            st.markdown(
+                '<div class="neon-divider" style="margin-top: 35px;"></div>'
+                '<div class="section-title">Candidate Region Comparison</div>',
+                unsafe_allow_html=True
+            )
 
             insight_col1, insight_col2 = st.columns([1, 1])
 
             with insight_col1:
                 st.markdown("#### Selected Region Summary")
 
+                # Rank of the selected region per objective, counting ties the way
+                # rank(method='max') does: candidates scoring <= the selected one
+                cols = _record_arrays(candidates, CANDIDATE_FIELDS)
+                selected_idx = np.flatnonzero(cols['region'] == result['region'])[0]
+                selected_ranks = {
+                    field: int(np.count_nonzero(cols[field] <= cols[field][selected_idx]))
+                    for field in ('carbon_intensity', 'latency', 'cost', 'score')
+                }
+                rank = selected_ranks['score']
+
+                # Summary card and ranking badge go out as a single message
                 st.markdown(f"""
                 <div class="insight-summary">
                     <div style="font-size: 1.5rem; font-weight: bold; color: #00d4ff; margin-bottom: 10px;">
@@ -1761,15 +2143,10 @@ def render_multi_objective_optimizer():
                         <strong style="color: white;">Score:</strong> {result['score']:.3f}
                     </div>
                 </div>
-                """, unsafe_allow_html=True)
-
-                # Trend analysis
-                rank = (candidates_df['score'] <= result['score']).sum()
-                st.markdown(f"""
                 <div style="margin-top: 15px; padding: 10px; background: rgba(0, 255, 170, 0.1);
                            border-radius: 8px; border: 1px solid rgba(0, 255, 170, 0.2);">
                     <strong style="color: #00ffaa;">Ranking:</strong>
-                    <span style="color: white; font-size: 1.1rem;">{rank} of {len(candidates_df)}</span> regions
+                    <span style="color: white; font-size: 1.1rem;">{rank} of {len(candidates)}</span> regions
                 </div>
                 """, unsafe_allow_html=True)
 
@@ -1780,15 +2157,15 @@ def render_multi_objective_optimizer():
                 insights = []
 
                 if norm_carbon > 40:
-                    carbon_rank = (candidates_df['carbon_intensity'] <= result['carbon_intensity']).sum()
+                    carbon_rank = selected_ranks['carbon_intensity']
                     insights.append(f"Low carbon intensity ranked #{carbon_rank} among candidates")
 
                 if norm_latency > 40:
-                    latency_rank = (candidates_df['latency'] <= result['latency']).sum()
+                    latency_rank = selected_ranks['latency']
                     insights.append(f"Network latency ranked #{latency_rank} for performance")
 
                 if norm_cost > 40:
-                    cost_rank = (candidates_df['cost'] <= result['cost']).sum()
+                    cost_rank = selected_ranks['cost']
                     insights.append(f"Cost efficiency ranked #{cost_rank} economically")
 
                 if not insights:
@@ -1798,10 +2175,10 @@ def render_multi_objective_optimizer():
                         "Best weighted score among all candidates"
                     ]
 
-                st.markdown('<ul class="insight-bullets">', unsafe_allow_html=True)
-                for insight in insights:
-                    st.markdown(f'<li>{insight}</li>', unsafe_allow_html=True)
-                st.markdown('</ul>', unsafe_allow_html=True)
+                html_parts = ['<ul class="insight-bullets">']
+                html_parts.extend(f'<li>{insight}</li>' for insight in insights)
+                html_parts.append('</ul>')
+                st.markdown("".join(html_parts), unsafe_allow_html=True)
 
     except ImportError as e:
         st.warning(f" Predictive scheduler not available: {str(e)}")
@@ -1810,33 +2187,85 @@ def render_multi_objective_optimizer():
         st.error(f" Error in multi-objective optimizer: {str(e)}")
 
 
+@st.cache_data(ttl=60, max_entries=4, show_spinner=False)
+def _csv_bytes(fingerprint, _logs_df):
+    """CSV export payload, serialized once per distinct log frame"""
+    buf = io.BytesIO()
+    _logs_df.to_csv(buf, index=False)
+    return buf.getvalue()
+
+
+def _json_default(value):
+    """orjson fallback for pandas scalars it cannot encode natively"""
+    if value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+@st.cache_data(ttl=60, max_entries=4, show_spinner=False)
+def _json_bytes(fingerprint, _logs_df):
+    """JSON export payload, serialized once per distinct log frame"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            _logs_df.to_dict(orient='records'),
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+    buf = io.BytesIO()
+    _logs_df.to_json(buf, orient='records', date_format='iso', indent=2)
+    return buf.getvalue()
+
+
+@st.cache_data(ttl=60, max_entries=4, show_spinner=False)
+def _parquet_bytes(fingerprint, _logs_df):
+    """Parquet export payload written through pyarrow"""
+    buf = io.BytesIO()
+    _logs_df.to_parquet(buf, index=False, engine='pyarrow')
+    return buf.getvalue()
+
+
+@st.fragment
 def render_export_section(logs_df):
-    """Render data export options"""
+    """Render data export options (a download click reruns only this fragment)"""
     st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
 
-    col1, col2, col3, col4 = st.columns([2, 1, 1, 2])
+    if logs_df.empty:
+        return
+
+    fingerprint = _df_fingerprint(logs_df)
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+    col1, col2, col3, col4, col5 = st.columns([1.5, 1, 1, 1, 1.5])
 
     with col2:
-        if not logs_df.empty:
-            csv_data = logs_df.to_csv(index=False)
-            st.download_button(
-                label="Export CSV",
-                data=csv_data,
-                file_name=f"cass_lite_logs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv",
-                use_container_width=True
-            )
+        st.download_button(
+            label="Export CSV",
+            data=_csv_bytes(fingerprint, logs_df),
+            file_name=f"cass_lite_logs_{stamp}.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
 
     with col3:
-        if not logs_df.empty:
-            json_data = logs_df.to_json(orient='records', date_format='iso', indent=2)
-            st.download_button(
-                label="Export JSON",
-                data=json_data,
-                file_name=f"cass_lite_logs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                mime="application/json",
-                use_container_width=True
-            )
+        st.download_button(
+            label="Export JSON",
+            data=_json_bytes(fingerprint, logs_df),
+            file_name=f"cass_lite_logs_{stamp}.json",
+            mime="application/json",
+            use_container_width=True
+        )
+
+    with col4:
+        st.download_button(
+            label="Export Parquet",
+            data=_parquet_bytes(fingerprint, logs_df),
+            file_name=f"cass_lite_logs_{stamp}.parquet",
+            mime="application/vnd.apache.parquet",
+            use_container_width=True
+        )
 
 # ============================================================================
 # FOOTER
@@ -1857,72 +2286,13 @@ def render_footer():
 # MAIN APP
 # ============================================================================
 
-def main():
-    # PHASE 9: Auto-refresh for real-time updates
-    st_autorefresh(interval=30000, key="datarefresh")  # 30 seconds
-
-    # Render hero section
-    render_hero()
-
-    # Apply high contrast mode if enabled
-    apply_high_contrast_css()
-
-    # Sidebar controls
-    with st.sidebar:
-        st.markdown("###  Dashboard Controls")
-
-        # High Contrast Mode Toggle
-        st.markdown("---")
-        st.markdown("###  Accessibility")
-        high_contrast = st.checkbox(
-            "High Contrast Mode",
-            value=st.session_state.high_contrast,
-            help="Toggle high contrast mode for better visibility"
-        )
-
-        if high_contrast != st.session_state.high_contrast:
-            st.session_state.high_contrast = high_contrast
-            st.rerun()
-
-        # PHASE 9: Theme Toggle Button
-        theme_toggle = st.checkbox("🌙 Dark Mode", value=True)
-
-        st.markdown("---")
-        st.markdown("### Data Range")
-        days_filter = st.selectbox("Show last", [1, 3, 7, 14, 30], index=2)
-
-        st.markdown("---")
-        st.markdown("### Quick Actions")
-
-        if st.button("Trigger Scheduler"):
-            st.info("Triggering scheduler function...")
-            # Add logic to call Cloud Function
-
-        if st.button(" Refresh Data"):
-            st.session_state.data_loading_failed = False
-            st.rerun()
-
-        st.markdown("---")
-        st.markdown("### Cloud Run Metrics")
-
-        try:
-            # PHASE 9: Display Cloud Run metrics
-            st.metric("CPU Usage", "12%", "↓ 3%")
-            st.metric("Memory Usage", "256 MB", "↑ 5 MB")
-            st.metric("Request Count", "1.2K", "↑ 15%")
-        except Exception:
-            st.info("Metrics loading...")
-
-        st.markdown("---")
-        st.markdown("### Project Info")
-        st.markdown("""
-        **Project:** CASS-Lite v2
-        **Version:** 2.0.0
-        **Status:**  Active
-        **Region:** asia-south1
-        **Cost:** $0.08/month
-        """)
-
+@st.fragment(run_every=30)
+def live_section(days_filter):
+    """
+    Fetch data and render every data-driven section.
+    Runs as a fragment on a 30 second timer, so auto-refresh reruns only this
+    block while the hero, stylesheet and sidebar stay untouched.
+    """
     # Fetch data with loading indicators and error handling
     stats = None
     recent_logs = pd.DataFrame()
@@ -1931,27 +2301,25 @@ def main():
     try:
         # Show loading spinner while fetching data
         with st.spinner("Loading carbon intelligence data..."):
-            # Progress indicator
-            progress_bar = st.progress(0)
-
-            # Fetch stats
-            progress_bar.progress(25)
-            stats = get_summary_stats(days=days_filter)
+            # Progress indicator on the session's first load only; timed
+            # refreshes are mostly cache hits and finish before it would show
+            progress_bar = None if st.session_state.get('data_loaded') else st.progress(0)
 
-            # Fetch recent logs
-            progress_bar.progress(50)
-            recent_logs = fetch_recent_decisions(limit=100)
+            # One Firestore query per day window: the logs are its newest rows,
+            # and the stats and history are derived from the same cached load
+            recent_logs = fetch_recent_decisions(limit=100, days=days_filter)
+            if progress_bar is not None:
+                progress_bar.progress(60)
 
-            # Fetch region history
-            progress_bar.progress(75)
+            stats = get_summary_stats(days=days_filter)
             region_history = get_region_history(days=days_filter)
 
-            progress_bar.progress(100)
-            time.sleep(0.2)  # Brief pause to show completion
-            progress_bar.empty()
+            if progress_bar is not None:
+                progress_bar.empty()
 
             # Mark successful data load
             st.session_state.data_loading_failed = False
+            st.session_state.data_loaded = True
 
     except Exception as e:
         # Display error banner
@@ -1972,6 +2340,11 @@ def main():
             st.error(f"Critical error: {str(fallback_error)}")
             st.stop()
 
+    # Arrow-backed columns serialize to chart JSON and Arrow tables without
+    # walking Python object arrays; integer readings then shrink to int16/int32
+    recent_logs = _downcast_integers(recent_logs.convert_dtypes(dtype_backend='pyarrow'))
+    region_history = _downcast_integers(region_history.convert_dtypes(dtype_backend='pyarrow'))
+
     # Display data status indicator
     if st.session_state.data_loading_failed:
         st.markdown("""
@@ -1987,12 +2360,13 @@ def main():
 
     # Render metrics (with skeleton loaders if no data)
     if stats is None or len(recent_logs) == 0:
-        # Show skeleton loaders
-        st.markdown("### Loading Metrics...")
-        col1, col2, col3, col4 = st.columns(4)
-        for col in [col1, col2, col3, col4]:
-            with col:
-                st.markdown('<div class="skeleton" style="height: 150px;"></div>', unsafe_allow_html=True)
+        # Show skeleton loaders (one grid, one message)
+        st.markdown(
+            '### Loading Metrics...\n\n<div class="skeleton-grid">'
+            + '<div class="skeleton" style="height: 150px;"></div>' * 4
+            + '</div>',
+            unsafe_allow_html=True
+        )
     else:
         render_metrics(stats)
 
@@ -2003,8 +2377,7 @@ def main():
 
     with col1:
         if region_history.empty:
-            st.markdown("### Carbon Intensity Over Time")
-            st.markdown('<div class="skeleton" style="height: 400px;"></div>', unsafe_allow_html=True)
+            render_skeleton_block("Carbon Intensity Over Time", 400)
         else:
             render_carbon_intensity_chart(region_history)
 
@@ -2012,44 +2385,126 @@ def main():
         if stats:
             render_savings_gauge(stats.get('savings_percent', 0))
         else:
-            st.markdown("### Carbon Savings")
-            st.markdown('<div class="skeleton" style="height: 300px;"></div>', unsafe_allow_html=True)
+            render_skeleton_block("Carbon Savings", 300)
 
-    # PHASE 9: Geographic Map
-    if not recent_logs.empty:
-        render_geographic_map(recent_logs)
-    else:
-        st.markdown("### Global Carbon Intensity Map")
-        st.markdown('<div class="skeleton" style="height: 500px;"></div>', unsafe_allow_html=True)
-
-    # Two column layout for advanced charts
-    col3, col4 = st.columns(2)
+    # Below-the-fold sections live in tabs so only one is on screen at a time
+    tab_map, tab_insights, tab_optimizer, tab_logs = st.tabs(["Map", "Insights", "Optimizer", "Logs"])
 
-    with col3:
-        # Region frequency chart
+    with tab_map:
+        # PHASE 9: Geographic Map
         if not recent_logs.empty:
-            render_region_frequency_chart(recent_logs)
+            render_geographic_map(recent_logs)
         else:
-            st.markdown("### Region Selection Frequency")
-            st.markdown('<div class="skeleton" style="height: 400px;"></div>', unsafe_allow_html=True)
+            render_skeleton_block("Global Carbon Intensity Map", 500)
 
-    with col4:
-        # PHASE 9: Energy mix chart
-        render_energy_mix_chart(days=days_filter)
+    with tab_insights:
+        # Two column layout for advanced charts
+        col3, col4 = st.columns(2)
 
-    # PHASE 9: AI Insights Section
-    if stats and not recent_logs.empty:
-        render_ai_insights_section(recent_logs, stats, days=days_filter)
+        with col3:
+            # Region frequency chart
+            if not recent_logs.empty:
+                render_region_frequency_chart(recent_logs)
+            else:
+                render_skeleton_block("Region Selection Frequency", 400)
 
-    # Multi-Objective Optimization Section
-    render_multi_objective_optimizer()
+        with col4:
+            # PHASE 9: Energy mix chart
+            render_energy_mix_chart(days=days_filter)
+
+        # PHASE 9: AI Insights Section
+        if stats and not recent_logs.empty:
+            render_ai_insights_section(recent_logs, stats, days=days_filter)
+
+    with tab_optimizer:
+        # Multi-Objective Optimization Section
+        render_multi_objective_optimizer()
+
+    with tab_logs:
+        # Live logs table
+        render_logs_table(recent_logs)
 
-    # Live logs table
-    render_logs_table(recent_logs)
+        # PHASE 9: Export Section
+        if not recent_logs.empty:
+            render_export_section(recent_logs)
+
+def main():
+    # Render hero section
+    render_hero()
 
-    # PHASE 9: Export Section
-    if not recent_logs.empty:
-        render_export_section(recent_logs)
+    # Apply high contrast mode if enabled
+    apply_high_contrast_css()
+
+    # Sidebar controls
+    with st.sidebar:
+        st.markdown("###  Dashboard Controls")
+
+        # High Contrast Mode Toggle
+        st.markdown("---")
+        st.markdown("###  Accessibility")
+        high_contrast = st.checkbox(
+            "High Contrast Mode",
+            value=st.session_state.high_contrast,
+            help="Toggle high contrast mode for better visibility"
+        )
+
+        if high_contrast != st.session_state.high_contrast:
+            st.session_state.high_contrast = high_contrast
+            st.rerun()
+
+        st.checkbox(
+            "Low-Power Mode",
+            key='low_power',
+            help="Replace heavy charts with lightweight summaries on mobile or low-power devices"
+        )
+
+        # PHASE 9: Theme Toggle Button
+        theme_toggle = st.checkbox("🌙 Dark Mode", value=True)
+
+        st.markdown("---")
+        st.markdown("### Data Range")
+        days_filter = st.selectbox("Show last", [1, 3, 7, 14, 30], index=2)
+
+        st.markdown("---")
+        st.markdown("### Quick Actions")
+
+        if st.button("Trigger Scheduler"):
+            st.info("Triggering scheduler function...")
+            # Add logic to call Cloud Function
+
+        if st.button(" Refresh Data"):
+            # Only the Firestore data caches are dropped. The chart, table and
+            # insight caches below are keyed on what they render (a
+            # _df_fingerprint of the frame, or the gauge bucket and map values),
+            # so they rebuild as soon as the refetched data differs.
+            # The click already reruns the script and live_section runs below,
+            # so it refetches in this same run without a second st.rerun()
+            clear_data_caches()
+            st.session_state.data_loading_failed = False
+
+        st.markdown("---")
+        st.markdown("### Cloud Run Metrics")
+
+        try:
+            # PHASE 9: Display Cloud Run metrics
+            st.metric("CPU Usage", "12%", "↓ 3%")
+            st.metric("Memory Usage", "256 MB", "↑ 5 MB")
+            st.metric("Request Count", "1.2K", "↑ 15%")
+        except Exception:
+            st.info("Metrics loading...")
+
+        st.markdown("---")
+        st.markdown("### Project Info")
+        st.markdown("""
+        **Project:** CASS-Lite v2
+        **Version:** 2.0.0
+        **Status:**  Active
+        **Region:** asia-south1
+        **Cost:** $0.08/month
+        """)
+
+    # Live data section refreshes itself every 30 seconds
+    live_section(days_filter)
 
     # Footer
     render_footer()
@@ -2067,5 +2522,20 @@ def main():
 # ============================================================================
 
 if __name__ == "__main__":
-    main()
+    # Append ?profile=1 to the URL to get a pyinstrument report of one run
+    if st.query_params.get('profile'):
+        try:
+            from streamlit_profiler import Profiler
+            PROFILER_AVAILABLE = True
+        except ImportError:
+            PROFILER_AVAILABLE = False
+            st.sidebar.warning("streamlit-profiler not installed. Install with: pip install streamlit-profiler")
+
+        if PROFILER_AVAILABLE:
+            with Profiler():
+                main()
+        else:
+            main()
+    else:
+        main()
 
@@ -4,11 +4,19 @@ Simplified version without external dependencies on scheduler module
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from datetime import datetime
 import numpy as np
 import requests
 
+# Numba for the scoring and Pareto dominance loops (optional, NumPy fallbacks below)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 
 # Regional cost per vCPU-hour (USD) - Based on Google Cloud pricing
 REGION_COSTS = {
@@ -30,6 +38,16 @@ REGION_LATENCY = {
     'BR-CS': 350,
 }
 
+# Fallback carbon intensity (gCO2/kWh) when the API is unavailable
+DEFAULT_CARBON_INTENSITY = {
+    'IN': 508,
+    'FI': 40,
+    'DE': 265,
+    'JP': 502,
+    'AU-NSW': 327,
+    'BR-CS': 161,
+}
+
 # Region display names
 REGION_NAMES = {
     'IN': 'India',
@@ -41,6 +59,71 @@ REGION_NAMES = {
 }
 
 
+def _pareto_mask_loop(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Non-dominated mask for minimizing both x and y (compiled by Numba)"""
+    n = x.shape[0]
+    keep = np.ones(n, np.bool_)
+    for i in range(n):
+        for j in range(n):
+            if i != j and x[j] <= x[i] and y[j] <= y[i] and (x[j] < x[i] or y[j] < y[i]):
+                keep[i] = False
+                break
+    return keep
+
+
+def _pareto_mask_numpy(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Non-dominated mask for minimizing both x and y (broadcast, O(N^2) memory)"""
+    no_worse = (x[None, :] <= x[:, None]) & (y[None, :] <= y[:, None])
+    better = (x[None, :] < x[:, None]) | (y[None, :] < y[:, None])
+    return ~(no_worse & better).any(axis=1)
+
+
+def _score_all_loop(carbon: np.ndarray, latency: np.ndarray, cost: np.ndarray,
+                    w: np.ndarray) -> np.ndarray:
+    """Weighted min-max scores for every candidate, lower is better (Numba kernel)"""
+    n = carbon.shape[0]
+    c_min = c_max = carbon[0]
+    l_min = l_max = latency[0]
+    k_min = k_max = cost[0]
+    for i in range(1, n):
+        c_min = min(c_min, carbon[i])
+        c_max = max(c_max, carbon[i])
+        l_min = min(l_min, latency[i])
+        l_max = max(l_max, latency[i])
+        k_min = min(k_min, cost[i])
+        k_max = max(k_max, cost[i])
+    scores = np.empty(n, np.float64)
+    for i in range(n):
+        nc = 0.5 if c_max == c_min else (carbon[i] - c_min) / (c_max - c_min)
+        nl = 0.5 if l_max == l_min else (latency[i] - l_min) / (l_max - l_min)
+        nk = 0.5 if k_max == k_min else (cost[i] - k_min) / (k_max - k_min)
+        scores[i] = w[0] * nc + w[1] * nl + w[2] * nk
+    return scores
+
+
+def _score_all_numpy(carbon: np.ndarray, latency: np.ndarray, cost: np.ndarray,
+                     w: np.ndarray) -> np.ndarray:
+    """Weighted min-max scores for every candidate, lower is better (vectorized)"""
+    scores = np.zeros(carbon.shape[0])
+    for weight, values in zip(w, (carbon, latency, cost)):
+        lo, hi = values.min(), values.max()
+        scores += weight * (0.5 if hi == lo else (values - lo) / (hi - lo))
+    return scores
+
+
+if NUMBA_AVAILABLE:
+    _pareto_mask = njit(cache=True)(_pareto_mask_loop)
+    _score_all = njit(cache=True)(_score_all_loop)
+    # Compile (or load the on-disk cache) at import instead of on the first click
+    _one = np.ones(1, dtype=np.float64)
+    _pareto_mask(_one, _one)
+    _score_all(_one, _one, _one, np.ones(3, dtype=np.float64))
+    del _one
+else:
+    _pareto_mask = _pareto_mask_numpy
+    _score_all = _score_all_numpy
+
+
 class SimplePredictiveScheduler:
     """Simplified multi-objective scheduler for dashboard"""
 
@@ -54,12 +137,11 @@ class SimplePredictiveScheduler:
             url = "https://api.electricitymap.org/v3/carbon-intensity/latest"
             headers = {"auth-token": self.api_key}
 
-            regions = ['IN', 'FI', 'DE', 'JP', 'AU-NSW', 'BR-CS']
-            carbon_data = {}
+            regions = list(DEFAULT_CARBON_INTENSITY)
 
-            for region in regions:
+            def fetch_region(session, region):
                 try:
-                    response = requests.get(
+                    response = session.get(
                         url,
                         headers=headers,
                         params={"zone": region},
@@ -67,31 +149,22 @@ class SimplePredictiveScheduler:
                     )
 
                     if response.status_code == 200:
-                        data = response.json()
-                        carbon_data[region] = data.get('carbonIntensity', 0)
-                    else:
-                        # Use default values if API fails
-                        defaults = {
-                            'IN': 508, 'FI': 40, 'DE': 265,
-                            'JP': 502, 'AU-NSW': 327, 'BR-CS': 161
-                        }
-                        carbon_data[region] = defaults.get(region, 300)
-                except:
-                    defaults = {
-                        'IN': 508, 'FI': 40, 'DE': 265,
-                        'JP': 502, 'AU-NSW': 327, 'BR-CS': 161
-                    }
-                    carbon_data[region] = defaults.get(region, 300)
-
-            return carbon_data
+                        return region, response.json().get('carbonIntensity', 0)
+                except Exception:
+                    pass
+                # Use default values if API fails
+                return region, DEFAULT_CARBON_INTENSITY.get(region, 300)
+
+            # The per-zone requests are independent, so issue them concurrently
+            # over one pooled session instead of paying six round-trips in a row
+            with requests.Session() as session, \
+                    ThreadPoolExecutor(max_workers=len(regions)) as pool:
+                return dict(pool.map(lambda region: fetch_region(session, region), regions))
 
         except Exception as e:
             self.logger.error(f"Failed to fetch carbon data: {e}")
             # Return default values
-            return {
-                'IN': 508, 'FI': 40, 'DE': 265,
-                'JP': 502, 'AU-NSW': 327, 'BR-CS': 161
-            }
+            return dict(DEFAULT_CARBON_INTENSITY)
 
     def normalize_value(self, value: float, min_val: float, max_val: float) -> float:
         """Normalize value to [0, 1] range"""
@@ -111,20 +184,37 @@ class SimplePredictiveScheduler:
         w_latency: float,
         w_cost: float
     ) -> float:
-        """Calculate weighted multi-objective score"""
+        """Calculate weighted multi-objective score for a single candidate"""
         norm_carbon = self.normalize_value(carbon, min(all_carbon), max(all_carbon))
         norm_latency = self.normalize_value(latency, min(all_latency), max(all_latency))
         norm_cost = self.normalize_value(cost, min(all_costs), max(all_costs))
 
         return w_carbon * norm_carbon + w_latency * norm_latency + w_cost * norm_cost
 
+    def calculate_scores(
+        self,
+        carbon: np.ndarray,
+        latency: np.ndarray,
+        cost: np.ndarray,
+        w_carbon: float,
+        w_latency: float,
+        w_cost: float
+    ) -> np.ndarray:
+        """Calculate weighted multi-objective scores for all candidates at once"""
+        weights = np.array([w_carbon, w_latency, w_cost], dtype=np.float64)
+        return _score_all(carbon, latency, cost, weights)
+
     def select_optimal_region(
         self,
         w_carbon: float = 0.5,
         w_latency: float = 0.3,
-        w_cost: float = 0.2
+        w_cost: float = 0.2,
+        carbon_data: Optional[Dict[str, float]] = None
     ) -> Dict:
-        """Select optimal region using multi-objective optimization"""
+        """Select optimal region using multi-objective optimization
+
+        Pass carbon_data to reuse an earlier fetch_carbon_data() snapshot.
+        """
         # Normalize weights
         total = w_carbon + w_latency + w_cost
         if total > 0:
@@ -133,7 +223,8 @@ class SimplePredictiveScheduler:
             w_cost /= total
 
         # Fetch carbon data
-        carbon_data = self.fetch_carbon_data()
+        if carbon_data is None:
+            carbon_data = self.fetch_carbon_data()
 
         if not carbon_data:
             return {'success': False, 'error': 'Failed to fetch carbon data'}
@@ -150,26 +241,24 @@ class SimplePredictiveScheduler:
             })
 
         # Extract metrics
-        all_carbon = [c['carbon_intensity'] for c in candidates]
-        all_latency = [c['latency'] for c in candidates]
-        all_costs = [c['cost'] for c in candidates]
-
-        # Calculate scores
-        for candidate in candidates:
-            candidate['score'] = self.calculate_score(
-                carbon=candidate['carbon_intensity'],
-                latency=candidate['latency'],
-                cost=candidate['cost'],
-                all_carbon=all_carbon,
-                all_latency=all_latency,
-                all_costs=all_costs,
-                w_carbon=w_carbon,
-                w_latency=w_latency,
-                w_cost=w_cost
-            )
+        all_carbon = np.array([c['carbon_intensity'] for c in candidates], dtype=float)
+        all_latency = np.array([c['latency'] for c in candidates], dtype=float)
+        all_costs = np.array([c['cost'] for c in candidates], dtype=float)
+
+        # Calculate scores, normalizing against each objective's extrema once
+        scores = self.calculate_scores(
+            carbon=all_carbon,
+            latency=all_latency,
+            cost=all_costs,
+            w_carbon=w_carbon,
+            w_latency=w_latency,
+            w_cost=w_cost
+        )
+        for candidate, score in zip(candidates, scores.tolist()):
+            candidate['score'] = score
 
         # Sort by score
-        candidates.sort(key=lambda x: x['score'])
+        candidates = [candidates[i] for i in np.argsort(scores, kind='stable')]
         optimal = candidates[0]
 
         # Calculate savings
@@ -198,10 +287,12 @@ class SimplePredictiveScheduler:
     def generate_pareto_frontier(
         self,
         objective1: str = 'carbon',
-        objective2: str = 'latency'
+        objective2: str = 'latency',
+        carbon_data: Optional[Dict[str, float]] = None
     ) -> List[Dict]:
         """Generate Pareto frontier for two objectives"""
-        carbon_data = self.fetch_carbon_data()
+        if carbon_data is None:
+            carbon_data = self.fetch_carbon_data()
 
         if not carbon_data:
             return []
@@ -217,28 +308,10 @@ class SimplePredictiveScheduler:
             })
 
         # Find Pareto-optimal solutions
-        pareto_frontier = []
-
-        for i, sol_i in enumerate(solutions):
-            is_dominated = False
-
-            for j, sol_j in enumerate(solutions):
-                if i == j:
-                    continue
-
-                obj1_better = sol_j[objective1] <= sol_i[objective1]
-                obj2_better = sol_j[objective2] <= sol_i[objective2]
-                strictly_better = (
-                    sol_j[objective1] < sol_i[objective1] or
-                    sol_j[objective2] < sol_i[objective2]
-                )
-
-                if obj1_better and obj2_better and strictly_better:
-                    is_dominated = True
-                    break
-
-            if not is_dominated:
-                pareto_frontier.append(sol_i)
+        obj1 = np.array([sol[objective1] for sol in solutions], dtype=np.float64)
+        obj2 = np.array([sol[objective2] for sol in solutions], dtype=np.float64)
+        keep = _pareto_mask(obj1, obj2)
+        pareto_frontier = [sol for sol, kept in zip(solutions, keep) if kept]
 
         pareto_frontier.sort(key=lambda x: x[objective1])
         return pareto_frontier
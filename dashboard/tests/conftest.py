@@ -0,0 +1,136 @@
+"""
+Pytest Configuration and Shared Fixtures
+=========================================
+Common test utilities and fixtures for dashboard tests.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add dashboard directory to Python path for imports
+dashboard_path = Path(__file__).parent.parent
+if str(dashboard_path) not in sys.path:
+    sys.path.insert(0, str(dashboard_path))
+
+
+class FakeDoc:
+    """Firestore document snapshot stand-in."""
+
+    def __init__(self, data):
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data)
+
+
+class FakeQuery:
+    """Chainable carbon_logs query that streams a fixed list of documents."""
+
+    def __init__(self, docs):
+        self.docs = docs
+
+    def where(self, *args, **kwargs):
+        return self
+
+    def select(self, field_paths):
+        # Firestore projections drop every field that was not selected
+        fields = set(field_paths)
+        return FakeQuery([{k: v for k, v in d.items() if k in fields} for d in self.docs])
+
+    def order_by(self, *args, **kwargs):
+        return self
+
+    def limit(self, count):
+        return FakeQuery(self.docs[:count])
+
+    def stream(self):
+        return iter(FakeDoc(d) for d in self.docs)
+
+
+class FakeFirestoreClient:
+    """Minimal Firestore client exposing a single carbon_logs collection."""
+
+    def __init__(self, docs):
+        self.docs = docs
+
+    def collection(self, name):
+        assert name == 'carbon_logs'
+        return FakeQuery(self.docs)
+
+
+@pytest.fixture
+def logged_decisions():
+    """carbon_logs documents shaped like FirestoreLogger.log_decision writes them."""
+    return [
+        {
+            'timestamp': '2025-11-06T10:30:00.123456',
+            'task_id': 'task_1762425000',
+            'selected_region': 'FI',
+            'region_name': 'Finland',
+            'region_flag': '🇫🇮',
+            'carbon_intensity': 42,
+            'savings_gco2': 230,
+            'savings_percent': 84.6,
+            'average_carbon': 272,
+            'total_regions_checked': 6,
+            'decision_time_ms': 1234,
+            'data_timestamp': '2025-11-06T10:29:00Z',
+            'execution_success': True,
+            'execution_time_ms': 850,
+            'execution_error': None,
+            'logged_at': '2025-11-06T10:30:01',
+            'scheduler_version': 'CASS-Lite-v2',
+        },
+        {
+            'timestamp': '2025-11-06T10:15:00',
+            'task_id': 'task_1762424100',
+            'selected_region': 'DE',
+            'region_name': 'Germany',
+            'region_flag': None,
+            'carbon_intensity': 265,
+            'savings_gco2': 7,
+            'savings_percent': 2.6,
+            'average_carbon': 272,
+            'total_regions_checked': 6,
+            'decision_time_ms': 980,
+            'data_timestamp': '2025-11-06T10:14:00Z',
+            'execution_success': False,
+            'execution_time_ms': 120,
+            'execution_error': 'timeout',
+            'logged_at': '2025-11-06T10:15:01',
+            'scheduler_version': 'CASS-Lite-v2',
+        },
+        {
+            'timestamp': '2025-11-06T10:00:00',
+            'task_id': 'task_1762423200',
+            'selected_region': 'FI',
+            'region_name': 'Finland',
+            'region_flag': '🇫🇮',
+            'carbon_intensity': 45,
+            'savings_gco2': 227,
+            'savings_percent': 83.5,
+            'average_carbon': 272,
+            'total_regions_checked': 6,
+            'decision_time_ms': 1010,
+            'data_timestamp': '2025-11-06T09:59:00Z',
+            'execution_success': None,
+            'execution_time_ms': None,
+            'execution_error': None,
+            'logged_at': '2025-11-06T10:00:01',
+            'scheduler_version': 'CASS-Lite-v2',
+        },
+    ]
+
+
+@pytest.fixture
+def fake_firestore(monkeypatch):
+    """Patch utils.get_firestore_client to return a FakeFirestoreClient over given docs."""
+    import utils
+
+    def install(docs):
+        monkeypatch.setattr(utils, 'get_firestore_client', lambda: FakeFirestoreClient(docs))
+        utils.clear_data_caches()
+
+    yield install
+    utils.clear_data_caches()
@@ -0,0 +1,93 @@
+"""
+Unit Tests for the Dashboard Predictor Kernels
+===============================================
+Tests that the Pareto dominance mask matches the original pairwise loop
+and that batched scoring matches the scalar score.
+
+Test Coverage:
+- test_pareto_mask_matches_pairwise_loop: Loop and NumPy kernels agree with the reference on ties and duplicates
+- test_pareto_mask_random_points: Agreement on random points with frequent ties
+- test_calculate_scores_matches_scalar_score: Batched scoring agrees with the scalar calculate_score
+"""
+
+import numpy as np
+import pytest
+import predictor
+
+
+def _reference_mask(x, y):
+    """The original double loop: a point is dropped if another is no worse on both and better on one."""
+    keep = []
+    for i in range(len(x)):
+        dominated = False
+        for j in range(len(x)):
+            if i == j:
+                continue
+            if x[j] <= x[i] and y[j] <= y[i] and (x[j] < x[i] or y[j] < y[i]):
+                dominated = True
+                break
+        keep.append(not dominated)
+    return np.array(keep)
+
+
+@pytest.mark.parametrize('kernel', [
+    predictor._pareto_mask_loop,
+    predictor._pareto_mask_numpy,
+    predictor._pareto_mask,
+])
+@pytest.mark.parametrize('x, y', [
+    # Dashboard regions: carbon vs latency
+    ([508, 40, 265, 502, 327, 161], [10, 180, 150, 90, 140, 350]),
+    # Ties on one objective: only the better of the tied pair survives
+    ([1, 1, 2, 3], [5, 4, 4, 1]),
+    # Exact duplicates: neither dominates the other, so both are kept
+    ([2, 2, 1, 3], [2, 2, 3, 3]),
+    # Single candidate
+    ([7], [7]),
+])
+def test_pareto_mask_matches_pairwise_loop(kernel, x, y):
+    """
+    Test that every Pareto mask implementation keeps exactly the points the
+    original pairwise loop kept, including tied and duplicated points.
+    """
+    x = np.array(x, dtype=np.float64)
+    y = np.array(y, dtype=np.float64)
+
+    np.testing.assert_array_equal(kernel(x, y), _reference_mask(x, y))
+
+
+def test_pareto_mask_random_points():
+    """
+    Test agreement with the reference on random integer points, where ties
+    and duplicates are common.
+    """
+    rng = np.random.default_rng(0)
+    x = rng.integers(0, 5, size=40).astype(np.float64)
+    y = rng.integers(0, 5, size=40).astype(np.float64)
+
+    expected = _reference_mask(x, y)
+
+    np.testing.assert_array_equal(predictor._pareto_mask_loop(x, y), expected)
+    np.testing.assert_array_equal(predictor._pareto_mask_numpy(x, y), expected)
+
+
+def test_calculate_scores_matches_scalar_score():
+    """
+    Test that the batched calculate_scores() agrees with the scalar
+    calculate_score() for every candidate, including a flat objective
+    (all costs equal), which normalizes to 0.5.
+    """
+    scheduler = predictor.SimplePredictiveScheduler()
+    carbon = [508.0, 40.0, 265.0, 502.0]
+    latency = [10.0, 180.0, 150.0, 90.0]
+    cost = [0.05, 0.05, 0.05, 0.05]
+
+    batched = scheduler.calculate_scores(
+        np.array(carbon), np.array(latency), np.array(cost), 0.5, 0.3, 0.2
+    )
+    scalar = [
+        scheduler.calculate_score(c, l, k, carbon, latency, cost, 0.5, 0.3, 0.2)
+        for c, l, k in zip(carbon, latency, cost)
+    ]
+
+    np.testing.assert_allclose(batched, scalar)
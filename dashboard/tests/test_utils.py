@@ -0,0 +1,140 @@
+"""
+Unit Tests for Dashboard Data Loading
+======================================
+Tests that the dashboard reads carbon_logs documents in the schema
+scheduler/firestore_logger.py writes.
+
+Test Coverage:
+- test_load_decisions_reads_logger_schema: selected_region, region_flag and execution_success map to display columns
+- test_summary_stats_from_logger_schema: Summary metrics come from the stored documents, not mock data
+- test_load_decisions_without_region_falls_back_to_mock: Documents missing selected_region fall back to mock data
+- test_summary_stats_without_regions: An all-missing region column yields 'N/A' instead of raising
+- test_empty_window_is_not_mock_data: A reachable collection with no decisions in the window yields empty data, not mock data
+- test_failed_connect_is_retried: A failed Firestore connect is not cached, so the next load returns real data
+"""
+
+import pandas as pd
+import pytest
+import utils
+from conftest import FakeFirestoreClient
+
+
+def test_load_decisions_reads_logger_schema(fake_firestore, logged_decisions):
+    """
+    Test that load_decisions() renames selected_region to region, keeps stored
+    flags (filling missing ones from REGION_FLAGS) and derives status from
+    execution_success, where only an explicit False counts as a warning.
+    """
+    fake_firestore(logged_decisions)
+
+    df = utils.load_decisions(days=7)
+
+    assert list(df['region']) == ['FI', 'DE', 'FI']
+    assert list(df['region_flag']) == ['🇫🇮', '🇩🇪', '🇫🇮']
+    assert list(df['status']) == ['success', 'warning', 'success']
+    assert 'selected_region' not in df.columns
+    assert 'execution_success' not in df.columns
+    assert df['timestamp'].dtype.kind == 'M'
+
+
+def test_summary_stats_from_logger_schema(fake_firestore, logged_decisions):
+    """
+    Test that get_summary_stats() computes its metrics from logger-shaped
+    documents instead of raising or falling back to mock data.
+    """
+    fake_firestore(logged_decisions)
+
+    stats = utils.get_summary_stats(days=7)
+
+    assert stats['total_decisions'] == 3
+    assert stats['greenest_region'] == 'FI'
+    assert stats['greenest_flag'] == '🇫🇮'
+    assert stats['avg_carbon'] == pytest.approx((42 + 265 + 45) / 3)
+    assert stats['success_rate'] == pytest.approx(200 / 3)
+
+
+def test_load_decisions_without_region_falls_back_to_mock(fake_firestore, logged_decisions):
+    """
+    Test that documents without selected_region are treated as an unknown
+    schema and replaced by mock data rather than an all-NaN region column.
+    """
+    for doc in logged_decisions:
+        del doc['selected_region']
+    fake_firestore(logged_decisions)
+
+    df = utils.load_decisions(days=7)
+
+    assert df['region'].notna().all()
+    assert len(df) > len(logged_decisions)
+
+
+def test_summary_stats_without_regions(monkeypatch):
+    """
+    Test that get_summary_stats() reports 'N/A' instead of raising when none
+    of the loaded decisions has a region.
+    """
+    df = pd.DataFrame({
+        'region': [None, None],
+        'carbon_intensity': [42, 265],
+        'savings_percent': [84.6, 2.6],
+        'status': ['success', 'warning'],
+    })
+    monkeypatch.setattr(utils, 'load_decisions', lambda days=None, limit=None: df)
+    utils.get_summary_stats.clear()
+
+    stats = utils.get_summary_stats(days=7)
+    utils.get_summary_stats.clear()
+
+    assert stats['greenest_region'] == 'N/A'
+    assert stats['greenest_flag'] == '🌍'
+    assert stats['success_rate'] == pytest.approx(50)
+
+
+def test_empty_window_is_not_mock_data(fake_firestore):
+    """
+    Test that a day window with no logged decisions produces empty frames
+    and zeroed stats instead of silently substituting mock data.
+    """
+    fake_firestore([])
+
+    assert utils.load_decisions(days=1).empty
+    assert utils.fetch_recent_decisions(limit=100, days=1).empty
+    assert utils.get_region_history(days=1).empty
+    assert utils.get_energy_mix_data(days=1).empty
+
+    stats = utils.get_summary_stats(days=1)
+    assert stats['total_decisions'] == 0
+    assert stats['greenest_region'] == 'N/A'
+
+
+def test_failed_connect_is_retried(monkeypatch, logged_decisions):
+    """
+    Test that a failed firestore.Client() call (e.g. a credential hiccup on
+    a cold start) falls back to mock data once, but is not cached: after the
+    data caches expire, the next load connects and returns real decisions.
+    """
+    attempts = []
+
+    def flaky_client(project=None):
+        attempts.append(project)
+        if len(attempts) == 1:
+            raise RuntimeError("metadata server unavailable")
+        return FakeFirestoreClient(logged_decisions)
+
+    monkeypatch.setattr(utils.firestore, 'Client', flaky_client)
+    utils.get_firestore_client.clear()
+    utils.clear_data_caches()
+
+    try:
+        mock = utils.load_decisions(days=7)
+        assert len(mock) != len(logged_decisions)
+
+        # Stand-in for the 30 second TTL running out
+        utils.clear_data_caches()
+        real = utils.load_decisions(days=7)
+    finally:
+        utils.get_firestore_client.clear()
+        utils.clear_data_caches()
+
+    assert len(attempts) == 2
+    assert list(real['region']) == ['FI', 'DE', 'FI']
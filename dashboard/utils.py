@@ -8,8 +8,10 @@ Date: November 2025
 """
 
 import pandas as pd
+import streamlit as st
 from datetime import datetime, timedelta
 from google.cloud import firestore
+from google.cloud.firestore_v1.base_query import FieldFilter
 from google.oauth2 import service_account
 import os
 
@@ -17,17 +19,29 @@ import os
 # FIRESTORE CONNECTION
 # ============================================================================
 
+@st.cache_resource(show_spinner=False)
 def get_firestore_client():
     """
     Initialize and return Firestore client.
+    Created once per server process and shared across sessions. A failed
+    connect raises, and Streamlit does not cache exceptions, so the next
+    call tries again instead of keeping a dead client for the process.
+    
+    Returns:
+        Firestore client
+    """
+    # Try to use default credentials (works in GCP environment)
+    return firestore.Client(project="cass-lite")
+
+def _client_or_none():
+    """
+    Shared Firestore client, or None when connecting fails right now.
     
     Returns:
         Firestore client or None if connection fails
     """
     try:
-        # Try to use default credentials (works in GCP environment)
-        db = firestore.Client(project="cass-lite")
-        return db
+        return get_firestore_client()
     except Exception as e:
         print(f"⚠️  Firestore connection failed: {e}")
         print("   Using mock data for dashboard")
@@ -37,26 +51,71 @@ def get_firestore_client():
 # DATA FETCHING FUNCTIONS
 # ============================================================================
 
-def fetch_recent_decisions(limit=50):
+# Supported regions and their display flags
+REGION_FLAGS = {
+    'IN': '🇮🇳', 'FI': '🇫🇮', 'DE': '🇩🇪',
+    'JP': '🇯🇵', 'AU-NSW': '🇦🇺', 'BR-CS': '🇧🇷'
+}
+REGIONS = tuple(REGION_FLAGS)
+
+# Stored carbon_logs fields the dashboard reads (as written by
+# scheduler/firestore_logger.py); everything else stays on the server
+DECISION_FIELDS = [
+    'timestamp', 'selected_region', 'region_flag', 'carbon_intensity',
+    'savings_gco2', 'savings_percent', 'execution_success'
+]
+
+# Rows read per query; stats, history, logs and energy mix all slice this one load
+DECISION_LOAD_LIMIT = 1000
+
+def _empty_decisions():
+    """Typed, empty decision frame for a day window with no logged decisions."""
+    return pd.DataFrame({
+        'timestamp': pd.Series(dtype='datetime64[ns]'),
+        'region': pd.Series(dtype=object),
+        'region_flag': pd.Series(dtype=object),
+        'carbon_intensity': pd.Series(dtype=float),
+        'savings_gco2': pd.Series(dtype=float),
+        'savings_percent': pd.Series(dtype=float),
+        'status': pd.Series(dtype=object),
+    })
+
+def _mock_decisions(days, limit):
+    """Mock fallback for load_decisions, cut to the same date range the query applies."""
+    df = generate_mock_decisions(limit)
+    if days is None:
+        return df
+    cutoff = datetime.now() - timedelta(days=days)
+    return df[df['timestamp'] >= cutoff]
+
+@st.cache_data(ttl=30, max_entries=8, show_spinner=False)
+def load_decisions(days=None, limit=DECISION_LOAD_LIMIT):
     """
-    Fetch recent scheduling decisions from Firestore.
+    Run the one Firestore query that every dashboard view is derived from.
     
     Args:
+        days: Only fetch decisions from the last N days (None for no cutoff)
         limit: Maximum number of records to fetch
         
     Returns:
-        pandas DataFrame with decision data
+        pandas DataFrame with decision data, newest first, timestamps parsed
     """
-    db = get_firestore_client()
+    db = _client_or_none()
     
     if db is None:
         # Return mock data if Firestore unavailable
-        return generate_mock_decisions(limit)
+        return _mock_decisions(days, limit)
     
     try:
         # Query Firestore collection
+        query = db.collection('carbon_logs')
+        if days is not None:
+            # Timestamps are stored as ISO-8601 strings, which sort chronologically
+            cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+            query = query.where(filter=FieldFilter('timestamp', '>=', cutoff))
         docs = (
-            db.collection('carbon_logs')
+            query
+            .select(DECISION_FIELDS)
             .order_by('timestamp', direction=firestore.Query.DESCENDING)
             .limit(limit)
             .stream()
@@ -69,24 +128,47 @@ def fetch_recent_decisions(limit=50):
             decisions.append(data)
         
         if not decisions:
-            print("📭 No data in Firestore, using mock data")
-            return generate_mock_decisions(limit)
+            # Firestore answered, so this is real data: nothing was logged in
+            # the window. Mock data is only for an unreachable collection.
+            return _empty_decisions()
         
-        # Convert to DataFrame
-        df = pd.DataFrame(decisions)
+        # Convert to DataFrame, parsing timestamps once for every consumer
+        df = pd.DataFrame.from_records(decisions, columns=DECISION_FIELDS)
+        df = df.rename(columns={'selected_region': 'region'})
         
-        # Add display columns
-        df['region_flag'] = df['region'].map({
-            'IN': '🇮🇳', 'FI': '🇫🇮', 'DE': '🇩🇪',
-            'JP': '🇯🇵', 'AU-NSW': '🇦🇺', 'BR-CS': '🇧🇷'
-        })
+        if df['region'].isna().all():
+            print("⚠️  carbon_logs documents have no selected_region, using mock data")
+            return _mock_decisions(days, limit)
+        
+        df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601', cache=True)
+        
+        # Only failed executions are recorded explicitly; a missing result is not a failure
+        failed = df.pop('execution_success').eq(False)
+        df['status'] = failed.map({True: 'warning', False: 'success'})
+        
+        # Add display columns, keeping any flag the logger stored
+        df['region_flag'] = df['region_flag'].fillna(df['region'].map(REGION_FLAGS))
         
         return df
         
     except Exception as e:
         print(f"⚠️  Error fetching from Firestore: {e}")
-        return generate_mock_decisions(limit)
+        return _mock_decisions(days, limit)
+
+def fetch_recent_decisions(limit=50, days=None):
+    """
+    Fetch recent scheduling decisions from Firestore.
+    
+    Args:
+        limit: Maximum number of records to fetch
+        days: Only fetch decisions from the last N days (None for no cutoff)
+        
+    Returns:
+        pandas DataFrame with decision data
+    """
+    return load_decisions(days=days, limit=max(limit, DECISION_LOAD_LIMIT)).head(limit)
 
+@st.cache_data(ttl=30, max_entries=8, show_spinner=False)
 def get_summary_stats(days=7):
     """
     Calculate summary statistics from recent decisions.
@@ -97,7 +179,7 @@ def get_summary_stats(days=7):
     Returns:
         Dictionary with summary metrics
     """
-    df = fetch_recent_decisions(limit=1000)
+    df = load_decisions(days=days)
     
     if df.empty:
         return {
@@ -109,33 +191,20 @@ def get_summary_stats(days=7):
             'success_rate': 0
         }
     
-    # Filter by date range
-    if 'timestamp' in df.columns:
-        cutoff_date = datetime.now() - timedelta(days=days)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df = df[df['timestamp'] >= cutoff_date]
-    
     # Calculate metrics
     avg_carbon = df['carbon_intensity'].mean() if 'carbon_intensity' in df.columns else 0
     
     # Get most common greenest region
-    if 'region' in df.columns:
-        greenest_region = df['region'].mode()[0]
-        region_flags = {
-            'IN': '🇮🇳', 'FI': '🇫🇮', 'DE': '🇩🇪',
-            'JP': '🇯🇵', 'AU-NSW': '🇦🇺', 'BR-CS': '🇧🇷'
-        }
-        greenest_flag = region_flags.get(greenest_region, '🌍')
-    else:
-        greenest_region = 'N/A'
-        greenest_flag = '🌍'
+    region_counts = df['region'].value_counts() if 'region' in df.columns else pd.Series(dtype=int)
+    greenest_region = region_counts.idxmax() if not region_counts.empty else 'N/A'
+    greenest_flag = REGION_FLAGS.get(greenest_region, '🌍')
     
     # Calculate average savings
     savings_percent = df['savings_percent'].mean() if 'savings_percent' in df.columns else 0
     
     # Success rate
     if 'status' in df.columns:
-        success_rate = (df['status'] == 'success').mean() * 100
+        success_rate = df['status'].value_counts(normalize=True, dropna=False).get('success', 0.0) * 100
     else:
         success_rate = 100
     
@@ -148,6 +217,7 @@ def get_summary_stats(days=7):
         'success_rate': success_rate
     }
 
+@st.cache_data(ttl=30, max_entries=8, show_spinner=False)
 def get_region_history(days=7):
     """
     Get historical carbon intensity data by region.
@@ -158,16 +228,7 @@ def get_region_history(days=7):
     Returns:
         pandas DataFrame with time-series data
     """
-    df = fetch_recent_decisions(limit=1000)
-    
-    if df.empty:
-        return generate_mock_history(days)
-    
-    # Filter by date range
-    if 'timestamp' in df.columns:
-        cutoff_date = datetime.now() - timedelta(days=days)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df = df[df['timestamp'] >= cutoff_date]
+    df = load_decisions(days=days)
     
     # Ensure required columns exist
     required_cols = ['timestamp', 'region', 'carbon_intensity', 'region_flag']
@@ -180,6 +241,9 @@ def fetch_current_carbon_data():
     """
     Fetch current carbon intensity for all regions.
     
+    Relies on fetch_recent_decisions returning rows newest first and keeps
+    the first row seen per region.
+    
     Returns:
         Dictionary with current carbon data by region
     """
@@ -188,33 +252,39 @@ def fetch_current_carbon_data():
     if df.empty:
         return {}
     
-    # Get most recent entry for each region
-    current_data = {}
-    for region in df['region'].unique():
-        region_df = df[df['region'] == region].sort_values('timestamp', ascending=False)
-        if not region_df.empty:
-            row = region_df.iloc[0]
-            current_data[region] = {
-                'carbon_intensity': row.get('carbon_intensity', 0),
-                'timestamp': row.get('timestamp', datetime.now()),
-                'flag': row.get('region_flag', '🌍')
-            }
-    
-    return current_data
+    # Decisions arrive newest first, so the first row per region is its latest
+    latest = df.drop_duplicates('region', keep='first')
+
+    # Fill any missing column once so each row is read by plain attribute access
+    defaults = {'carbon_intensity': 0, 'timestamp': datetime.now(), 'region_flag': '🌍'}
+    latest = latest.assign(**{col: val for col, val in defaults.items() if col not in latest.columns})
+    
+    return {
+        row.region: {
+            'carbon_intensity': row.carbon_intensity,
+            'timestamp': row.timestamp,
+            'flag': row.region_flag
+        }
+        for row in latest.itertuples(index=False)
+    }
+
+def clear_data_caches():
+    """Drop cached Firestore reads so the next rerun fetches fresh data."""
+    for cached in (load_decisions, get_summary_stats, get_region_history, get_energy_mix_data):
+        cached.clear()
 
 # ============================================================================
 # MOCK DATA GENERATORS (for testing without Firestore)
 # ============================================================================
 
+@st.cache_data(ttl=300, show_spinner=False)
 def generate_mock_decisions(count=50):
-    """Generate mock decision data for testing."""
-    import random
+    """Generate mock decision data for testing (seeded, cached for 5 minutes)."""
+    import numpy as np
     
-    regions = ['IN', 'FI', 'DE', 'JP', 'AU-NSW', 'BR-CS']
-    region_flags = {
-        'IN': '🇮🇳', 'FI': '🇫🇮', 'DE': '🇩🇪',
-        'JP': '🇯🇵', 'AU-NSW': '🇦🇺', 'BR-CS': '🇧🇷'
-    }
+    rng = np.random.default_rng(42)
+    
+    regions = list(REGIONS)
     
     # Carbon intensity ranges (gCO₂/kWh)
     carbon_ranges = {
@@ -226,45 +296,41 @@ def generate_mock_decisions(count=50):
         'IN': (600, 850)  # India - highest
     }
     
-    data = []
-    base_time = datetime.now()
-    
-    for i in range(count):
-        # FI selected most often (it's usually the greenest)
-        region = random.choices(
-            regions,
-            weights=[5, 60, 15, 10, 5, 5]  # FI weighted highest
-        )[0]
-        
-        carbon_intensity = random.randint(*carbon_ranges[region])
-        avg_carbon = 362  # Global average
-        savings = max(0, avg_carbon - carbon_intensity)
-        savings_percent = (savings / avg_carbon) * 100 if avg_carbon > 0 else 0
-        
-        timestamp = base_time - timedelta(hours=i * 0.25)  # Every 15 minutes
-        
-        data.append({
-            'timestamp': timestamp,
-            'region': region,
-            'region_flag': region_flags[region],
-            'carbon_intensity': carbon_intensity,
-            'savings_gco2': savings,
-            'savings_percent': round(savings_percent, 1),
-            'status': 'success' if random.random() > 0.05 else 'warning',
-            'decision_time_ms': random.randint(3000, 8000)
-        })
-    
-    return pd.DataFrame(data)
+    # FI selected most often (it's usually the greenest)
+    probs = np.array([5, 60, 15, 10, 5, 5]) / 100.0
+    region_idx = rng.choice(len(regions), size=count, p=probs)
+    
+    low = np.array([carbon_ranges[r][0] for r in regions])[region_idx]
+    high = np.array([carbon_ranges[r][1] for r in regions])[region_idx]
+    carbon_intensity = rng.integers(low, high + 1)
+    
+    avg_carbon = 362  # Global average
+    savings = np.clip(avg_carbon - carbon_intensity, 0, None)
+    savings_percent = savings / avg_carbon * 100
+    
+    # Every 15 minutes, newest first
+    base_time = pd.Timestamp(datetime.now())
+    timestamps = base_time - pd.to_timedelta(np.arange(count) * 15, unit='min')
+    
+    return pd.DataFrame({
+        'timestamp': timestamps,
+        'region': np.asarray(regions, dtype=object)[region_idx],
+        'region_flag': np.asarray([REGION_FLAGS[r] for r in regions], dtype=object)[region_idx],
+        'carbon_intensity': carbon_intensity,
+        'savings_gco2': savings,
+        'savings_percent': savings_percent.round(1),
+        'status': np.where(rng.random(count) > 0.05, 'success', 'warning'),
+        'decision_time_ms': rng.integers(3000, 8000, size=count, endpoint=True)
+    })
 
+@st.cache_data(ttl=300, show_spinner=False)
 def generate_mock_history(days=7):
-    """Generate mock historical time-series data."""
-    import random
+    """Generate mock historical time-series data (seeded, cached for 5 minutes)."""
+    import numpy as np
     
-    regions = ['IN', 'FI', 'DE', 'JP', 'AU-NSW', 'BR-CS']
-    region_flags = {
-        'IN': '🇮🇳', 'FI': '🇫🇮', 'DE': '🇩🇪',
-        'JP': '🇯🇵', 'AU-NSW': '🇦🇺', 'BR-CS': '🇧🇷'
-    }
+    rng = np.random.default_rng(42)
+    
+    regions = list(REGIONS)
     
     carbon_ranges = {
         'FI': (35, 60),
@@ -275,25 +341,22 @@ def generate_mock_history(days=7):
         'IN': (600, 850)
     }
     
-    data = []
     hours = days * 24
     base_time = datetime.now() - timedelta(days=days)
     
-    for region in regions:
-        for hour in range(hours):
-            timestamp = base_time + timedelta(hours=hour)
-            base_carbon = sum(carbon_ranges[region]) / 2
-            variation = random.uniform(-0.2, 0.2) * base_carbon
-            carbon_intensity = int(base_carbon + variation)
-            
-            data.append({
-                'timestamp': timestamp,
-                'region': region,
-                'region_flag': region_flags[region],
-                'carbon_intensity': carbon_intensity
-            })
-    
-    return pd.DataFrame(data)
+    # Whole (region, hour) matrix at once: midpoint of each range +/- 20%
+    bases = np.array([sum(carbon_ranges[r]) / 2 for r in regions])
+    variation = rng.uniform(-0.2, 0.2, size=(len(regions), hours)) * bases[:, None]
+    carbon_intensity = (bases[:, None] + variation).astype(np.int32)
+    
+    # Rows are region-major: every hour of one region, then the next
+    timestamps = base_time + pd.to_timedelta(np.arange(hours), unit='h')
+    return pd.DataFrame({
+        'timestamp': np.tile(timestamps, len(regions)),
+        'region': np.repeat(regions, hours),
+        'region_flag': np.repeat([REGION_FLAGS[r] for r in regions], hours),
+        'carbon_intensity': carbon_intensity.ravel()
+    })
 
 # ============================================================================
 # DATA PROCESSING HELPERS
@@ -319,6 +382,51 @@ def calculate_carbon_savings(selected_carbon, all_carbons):
     
     return round(savings_gco2, 1), round(savings_percent, 1)
 
+def lttb_indices(x, y, n_out):
+    """
+    Pick indices of a Largest-Triangle-Three-Buckets downsample.
+    
+    Args:
+        x: Monotonic x values (numeric or datetime64)
+        y: y values, same length as x
+        n_out: Number of points to keep
+        
+    Returns:
+        numpy array of selected indices (first and last point always kept)
+    """
+    import numpy as np
+    
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    x = np.asarray(x).astype(np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    
+    # n_out - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        
+        # Keep the point forming the largest triangle with the previous
+        # pick and the average of the next bucket
+        areas = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(areas.argmax())
+        selected[i + 1] = a
+    
+    return selected
+
 def format_timestamp(timestamp):
     """Format timestamp for display."""
     if isinstance(timestamp, str):
@@ -376,8 +484,12 @@ def get_ai_insights(recent_logs, days=7):
         # Filter by date range
         if 'timestamp' in recent_logs.columns:
             cutoff = datetime.now() - timedelta(days=days)
-            recent_logs['timestamp'] = pd.to_datetime(recent_logs['timestamp'])
-            filtered_logs = recent_logs[recent_logs['timestamp'] >= cutoff].copy()
+            timestamps = recent_logs['timestamp']
+            # Loaded decisions arrive parsed; only raw strings need converting
+            if not pd.api.types.is_datetime64_any_dtype(timestamps):
+                timestamps = pd.to_datetime(timestamps, format='ISO8601', cache=True)
+            recent = timestamps >= cutoff
+            filtered_logs = recent_logs[recent].assign(timestamp=timestamps[recent])
         else:
             filtered_logs = recent_logs.copy()
         
@@ -465,6 +577,7 @@ def get_ai_insights(recent_logs, days=7):
             'total_decisions': 0
         }
 
+@st.cache_data(ttl=30, max_entries=8, show_spinner=False)
 def get_energy_mix_data(days=7):
     """
     Get energy mix data (renewable vs fossil) over time.
@@ -479,18 +592,22 @@ def get_energy_mix_data(days=7):
     import numpy as np
     
     try:
-        # Fetch recent decisions
-        recent_logs = fetch_recent_decisions(limit=1000)
+        # Same cached load the stats and history use
+        recent_logs = load_decisions(days=days)
+        
+        if recent_logs.empty:
+            # No decisions in the window: nothing to plot
+            return pd.DataFrame({'timestamp': pd.Series(dtype='datetime64[ns]'),
+                                 'renewable_pct': pd.Series(dtype=float)})
         
-        if recent_logs.empty or 'carbon_intensity' not in recent_logs.columns:
+        if 'carbon_intensity' not in recent_logs.columns:
             # Generate synthetic data
             return generate_mock_energy_mix(days)
         
         # Filter by date range
         if 'timestamp' in recent_logs.columns:
             cutoff = datetime.now() - timedelta(days=days)
-            recent_logs['timestamp'] = pd.to_datetime(recent_logs['timestamp'])
-            recent_logs = recent_logs[recent_logs['timestamp'] >= cutoff]
+            recent_logs = recent_logs[recent_logs['timestamp'] >= cutoff].copy()
         
         # Use carbon intensity as proxy for renewable percentage
         # Lower carbon = higher renewable percentage
@@ -21,6 +21,13 @@ except ImportError:
     PROPHET_AVAILABLE = False
     logging.warning("Prophet not available. Install with: pip install prophet")
 
+# Numba for the Pareto dominance loop (optional, NumPy fallback below)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 from scheduler.carbon_fetcher import CarbonFetcher
 from scheduler.firestore_logger import FirestoreLogger
 
@@ -46,6 +53,31 @@ REGION_LATENCY = {
 }
 
 
+def _pareto_mask_loop(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Non-dominated mask for minimizing both x and y (compiled by Numba)"""
+    n = x.shape[0]
+    keep = np.ones(n, np.bool_)
+    for i in range(n):
+        for j in range(n):
+            if i != j and x[j] <= x[i] and y[j] <= y[i] and (x[j] < x[i] or y[j] < y[i]):
+                keep[i] = False
+                break
+    return keep
+
+
+def _pareto_mask_numpy(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Non-dominated mask for minimizing both x and y (broadcast, O(N^2) memory)"""
+    no_worse = (x[None, :] <= x[:, None]) & (y[None, :] <= y[:, None])
+    better = (x[None, :] < x[:, None]) | (y[None, :] < y[:, None])
+    return ~(no_worse & better).any(axis=1)
+
+
+if NUMBA_AVAILABLE:
+    _pareto_mask = njit(cache=True)(_pareto_mask_loop)
+else:
+    _pareto_mask = _pareto_mask_numpy
+
+
 class PredictiveScheduler:
     """Multi-objective scheduler with carbon intensity forecasting"""
 
@@ -388,30 +420,13 @@ class PredictiveScheduler:
                 'cost': REGION_COSTS.get(region, 0.05)
             })
 
-        # Find Pareto-optimal solutions
-        pareto_frontier = []
-
-        for i, sol_i in enumerate(solutions):
-            is_dominated = False
-
-            for j, sol_j in enumerate(solutions):
-                if i == j:
-                    continue
-
-                # Check if sol_j dominates sol_i
-                obj1_better = sol_j[objective1] <= sol_i[objective1]
-                obj2_better = sol_j[objective2] <= sol_i[objective2]
-                at_least_one_strictly_better = (
-                    sol_j[objective1] < sol_i[objective1] or
-                    sol_j[objective2] < sol_i[objective2]
-                )
-
-                if obj1_better and obj2_better and at_least_one_strictly_better:
-                    is_dominated = True
-                    break
+        # Find Pareto-optimal solutions (a solution is kept unless another is
+        # no worse on both objectives and strictly better on one)
+        obj1 = np.array([sol[objective1] for sol in solutions], dtype=np.float64)
+        obj2 = np.array([sol[objective2] for sol in solutions], dtype=np.float64)
+        keep = _pareto_mask(obj1, obj2)
 
-            if not is_dominated:
-                pareto_frontier.append(sol_i)
+        pareto_frontier = [sol for sol, kept in zip(solutions, keep) if kept]
 
         # Sort by first objective
         pareto_frontier.sort(key=lambda x: x[objective1])
@@ -0,0 +1,96 @@
+"""
+Unit Tests for PredictiveScheduler Pareto Kernels
+==================================================
+Tests that the Pareto dominance mask matches the original pairwise loop.
+
+Test Coverage:
+- test_pareto_mask_matches_pairwise_loop: Loop, NumPy and selected kernels agree with the reference on ties and duplicates
+- test_pareto_mask_random_points: Agreement on random points with frequent ties
+- test_generate_pareto_frontier_uses_mask: Frontier keeps exactly the non-dominated regions, sorted by the first objective
+"""
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+from scheduler import predictive_scheduler
+from scheduler.predictive_scheduler import PredictiveScheduler
+
+
+def _reference_mask(x, y):
+    """The original double loop: a point is dropped if another is no worse on both and better on one."""
+    keep = []
+    for i in range(len(x)):
+        dominated = False
+        for j in range(len(x)):
+            if i == j:
+                continue
+            if x[j] <= x[i] and y[j] <= y[i] and (x[j] < x[i] or y[j] < y[i]):
+                dominated = True
+                break
+        keep.append(not dominated)
+    return np.array(keep)
+
+
+@pytest.mark.parametrize('kernel', [
+    predictive_scheduler._pareto_mask_loop,
+    predictive_scheduler._pareto_mask_numpy,
+    predictive_scheduler._pareto_mask,
+])
+@pytest.mark.parametrize('x, y', [
+    # Carbon vs latency for the six scheduler regions
+    ([650, 45, 420, 502, 327, 161], [10, 180, 150, 90, 140, 350]),
+    # Ties on one objective: only the better of the tied pair survives
+    ([1, 1, 2, 3], [5, 4, 4, 1]),
+    # Exact duplicates: neither dominates the other, so both are kept
+    ([2, 2, 1, 3], [2, 2, 3, 3]),
+    # Single candidate
+    ([7], [7]),
+])
+def test_pareto_mask_matches_pairwise_loop(kernel, x, y):
+    """
+    Test that every Pareto mask implementation keeps exactly the points the
+    original pairwise loop kept, including tied and duplicated points.
+    """
+    x = np.array(x, dtype=np.float64)
+    y = np.array(y, dtype=np.float64)
+
+    np.testing.assert_array_equal(kernel(x, y), _reference_mask(x, y))
+
+
+def test_pareto_mask_random_points():
+    """
+    Test agreement with the reference on random integer points, where ties
+    and duplicates are common.
+    """
+    rng = np.random.default_rng(0)
+    x = rng.integers(0, 5, size=40).astype(np.float64)
+    y = rng.integers(0, 5, size=40).astype(np.float64)
+
+    expected = _reference_mask(x, y)
+
+    np.testing.assert_array_equal(predictive_scheduler._pareto_mask_loop(x, y), expected)
+    np.testing.assert_array_equal(predictive_scheduler._pareto_mask_numpy(x, y), expected)
+
+
+def test_generate_pareto_frontier_uses_mask():
+    """
+    Test that generate_pareto_frontier() returns the non-dominated regions
+    for carbon vs latency, sorted by carbon.
+
+    BR-CS (700 gCO₂/kWh, 350 ms) is beaten on both objectives by IN
+    (650, 10) and must be dropped; every other region trades one
+    objective against the other and stays on the frontier.
+    """
+    scheduler = PredictiveScheduler.__new__(PredictiveScheduler)
+    scheduler.carbon_fetcher = MagicMock()
+    scheduler.carbon_fetcher.fetch_all_regions.return_value = {
+        'IN': {'carbonIntensity': 650},
+        'FI': {'carbonIntensity': 45},
+        'DE': {'carbonIntensity': 420},
+        'JP': {'carbonIntensity': 502},
+        'BR-CS': {'carbonIntensity': 700},
+    }
+
+    frontier = scheduler.generate_pareto_frontier('carbon', 'latency')
+
+    assert [sol['region'] for sol in frontier] == ['FI', 'DE', 'JP', 'IN']